@@ -0,0 +1,5 @@
+"""Data access and analysis core for the BlueBARGE shore power app.
+
+Submodules are imported explicitly (``from bluebarge.sheets import ...``) so
+that pulling in one piece never drags the whole dependency tree along.
+"""
@@ -0,0 +1,84 @@
+"""Optimal assignment of a barge fleet to concurrent vessel calls.
+
+Every barge x call pair is scored with the rules of the "Try a Compatibility
+Match" expander: the average of the power and energy cover
+(:func:`~bluebarge.scoring.scaled_scores`) and the standard and voltage
+matches (:func:`~bluebarge.scoring.binary_scores`).  Voltage and standard
+are hard constraints; pairs violating them, or without a score, get a
+prohibitive cost and are never reported as assigned.  The assignment maximizing the total score is solved with the Hungarian
+algorithm (``scipy.optimize.linear_sum_assignment``), separately per time
+slot when calls carry one.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from bluebarge.scoring import binary_scores, scaled_scores
+
+# cost of a pair violating a hard constraint (scores are at most 100)
+INFEASIBLE_COST = 1e6
+
+
+def _cover(provided: pd.Series, required: pd.Series) -> np.ndarray:
+    return scaled_scores(provided.to_numpy(float)[:, None], required.to_numpy(float)[None, :])
+
+
+def score_matrix(barges: pd.DataFrame, calls: pd.DataFrame):
+    """(scores, feasible): B x C match scores in percent and the hard-constraint mask."""
+    power = _cover(barges["power_mw"], calls["required_power_mw"])
+    energy = _cover(barges["energy_mwh"], calls["required_energy_mwh"])
+    standard = binary_scores(barges["standards"], calls["required_standard"], outer=True)
+    voltage = binary_scores(barges["voltage_levels"], calls["required_voltage"], outer=True)
+    scores = (power + energy + standard + voltage) / 4
+    # a pair without a score (unknown demand or capacity) is never assigned
+    return scores, (standard > 0) & (voltage > 0) & np.isfinite(scores)
+
+
+def _solve(scores: np.ndarray, feasible: np.ndarray):
+    # scipy only loads once an assignment is solved; score_matrix (and the
+    # design explorer built on it) does not need it
+    from scipy.optimize import linear_sum_assignment
+
+    cost = np.where(feasible, -scores, INFEASIBLE_COST)
+    rows, cols = linear_sum_assignment(cost)
+    keep = feasible[rows, cols]
+    return rows[keep], cols[keep]
+
+
+def assign(
+    barges: pd.DataFrame,
+    calls: pd.DataFrame,
+    slot_column: Optional[str] = None,
+) -> pd.DataFrame:
+    """Best barge per call, at most one call per barge (per slot).
+
+    ``barges`` needs ``power_mw``, ``energy_mwh``, ``standards`` and
+    ``voltage_levels`` (lists or comma separated strings); ``calls`` the
+    ``required_*`` columns of a demand profile.  Returns one row per call
+    with the assigned barge position (``-1`` if unserved) and its score.
+    """
+    calls = calls.reset_index(drop=True)
+    scores, feasible = score_matrix(barges.reset_index(drop=True), calls)
+    barge = np.full(len(calls), -1)
+    score = np.full(len(calls), np.nan)
+    if slot_column is None:
+        slots = [np.arange(len(calls))]
+    else:
+        slots = list(calls.groupby(slot_column, sort=False).indices.values())
+    for positions in slots:
+        rows, cols = _solve(scores[:, positions], feasible[:, positions])
+        barge[positions[cols]] = rows
+        score[positions[cols]] = scores[rows, positions[cols]]
+
+    result = calls.copy()
+    result["barge"] = barge
+    if "name" in barges.columns:
+        names = barges["name"].to_numpy(object)
+        result["barge_name"] = np.where(barge >= 0, names[np.maximum(barge, 0)], None)
+    result["score"] = np.round(score, 2)
+    return result
+
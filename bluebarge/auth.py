@@ -0,0 +1,52 @@
+"""Process-wide authorized gspread client.
+
+Credentials are built in memory from the service account mapping (no key file
+on disk) and the client is created once per process and shared by every
+Streamlit session.  google-auth refreshes the access token on its own when it
+expires; :func:`auth_exchange_count` reports how many token exchanges the
+process has performed so far.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Mapping, Tuple
+
+import gspread
+from google.oauth2.service_account import Credentials
+
+SCOPES = [
+    "https://spreadsheets.google.com/feeds",
+    "https://www.googleapis.com/auth/drive",
+]
+
+_lock = threading.Lock()
+_clients: Dict[Tuple[str, str], gspread.Client] = {}
+_exchanges = 0
+
+
+class _CountingCredentials(Credentials):
+    """Service account credentials that count OAuth token exchanges."""
+
+    def refresh(self, request: Any) -> None:
+        global _exchanges
+        super().refresh(request)
+        with _lock:
+            _exchanges += 1
+
+
+def get_client(service_account_info: Mapping[str, Any]) -> gspread.Client:
+    """Return the shared client for this service account, authorizing once."""
+    info = dict(service_account_info)
+    key = (info.get("client_email", ""), info.get("private_key_id", ""))
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            creds = _CountingCredentials.from_service_account_info(info, scopes=SCOPES)
+            client = _clients[key] = gspread.authorize(creds)
+        return client
+
+
+def auth_exchange_count() -> int:
+    """Number of OAuth token exchanges performed by this process."""
+    return _exchanges
@@ -0,0 +1,217 @@
+"""Score a file of port calls from the command line.
+
+Each input row is one call: ``ship_type``, ``method`` (IMO, EMSA, LF or
+Average) and ``Port``, optionally a ``voltage`` (used when the ship supports
+both and the choice is free; HV otherwise, like the app's default) and a
+barge spec (``barge_power_mw``, ``barge_energy_mwh``, and comma separated
+``barge_standards`` / ``barge_voltage_levels``).  The rules are the app's:
+demand per method, the HV/LV decision, the IEC standard and the equipment
+match at the port.
+
+Calls whose ship type or method is not in the Ship Demand sheet have no
+demand; their barge match columns are left empty (NaN).
+
+The input is streamed in chunks (CSV or Parquet) and results are appended to
+the output as each chunk is done, so memory stays bounded by the chunk size::
+
+    python -m bluebarge.batch calls.csv scored.parquet --fixture workbook.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from bluebarge.compatibility import VOLTAGES, compatibility_matrix
+from bluebarge.demand import build_demand_table
+from bluebarge.scoring import binary_scores, expected_plug_type, scaled_scores, standard_for_voltage
+from bluebarge.sheets import SheetSnapshot
+from bluebarge.store import DEFAULT_PATH, SnapshotStore
+
+CHUNKSIZE = 50_000
+
+BARGE_COLUMNS = ("barge_power_mw", "barge_energy_mwh", "barge_standards", "barge_voltage_levels")
+
+# input and output columns holding text
+TEXT_COLUMNS = (
+    "ship_type",
+    "method",
+    "Port",
+    "voltage",
+    "barge_standards",
+    "barge_voltage_levels",
+    "required_voltage",
+    "required_standard",
+    "plug_type",
+)
+
+DEMAND_COLUMNS = [
+    "ship_type",
+    "method",
+    "required_power_mw",
+    "required_energy_mwh",
+    "voltage_reason",
+    "required_voltage",
+]
+
+
+class BatchScorer:
+    """Per-snapshot lookups, applied to one chunk of calls at a time."""
+
+    def __init__(self, snapshot: SheetSnapshot):
+        table = build_demand_table(snapshot.ship_demand, snapshot.voltage_compatibility)
+        self.demand = table.frame.reset_index()[DEMAND_COLUMNS]
+        ship_types = self.demand["ship_type"].unique().tolist()
+        self.matrix = compatibility_matrix(snapshot.equipment, ship_types)
+        self._ship_pos = {s: i for i, s in enumerate(self.matrix.ship_types)}
+        self._voltage_pos = {v: i for i, v in enumerate(self.matrix.voltages)}
+        self._port_pos = {p: i for i, p in enumerate(self.matrix.ports)}
+
+    def score(self, calls: pd.DataFrame) -> pd.DataFrame:
+        out = calls.merge(self.demand, on=["ship_type", "method"], how="left")
+
+        # a requested voltage only counts where the ship leaves the choice open
+        voltage = out["required_voltage"].astype(object)
+        if "voltage" in out.columns:
+            choice = (out["voltage_reason"] == "choice").to_numpy()
+            requested = out["voltage"].astype(str).str.upper()
+            voltage = voltage.where(~choice | ~requested.isin(VOLTAGES), requested)
+        out["required_voltage"] = voltage
+        out["required_standard"] = voltage.map(standard_for_voltage)
+        out["plug_type"] = out["ship_type"].map(expected_plug_type)
+
+        s = out["ship_type"].map(self._ship_pos)
+        v = out["required_voltage"].map(self._voltage_pos)
+        p = out["Port"].map(self._port_pos)
+        known = (s.notna() & v.notna() & p.notna()).to_numpy()
+        counts = np.zeros(len(out), dtype=np.int64)
+        counts[known] = self.matrix.counts[
+            s[known].astype(int), v[known].astype(int), p[known].astype(int)
+        ]
+        out["compatible_equipment"] = counts
+        out["compatible"] = counts > 0
+
+        if set(BARGE_COLUMNS) <= set(out.columns):
+            out = self._score_barge(out)
+        return out.drop(columns=["voltage_reason"])
+
+    @staticmethod
+    def _covers(provided: pd.Series, required: pd.Series) -> np.ndarray:
+        return scaled_scores(pd.to_numeric(provided, errors="coerce"), required.to_numpy(float))
+
+    def _score_barge(self, out: pd.DataFrame) -> pd.DataFrame:
+        matches = ["power_match", "energy_match", "standard_match", "voltage_match"]
+        out["power_match"] = self._covers(out["barge_power_mw"], out["required_power_mw"])
+        out["energy_match"] = self._covers(out["barge_energy_mwh"], out["required_energy_mwh"])
+        out["standard_match"] = binary_scores(out["barge_standards"], out["required_standard"])
+        out["voltage_match"] = binary_scores(out["barge_voltage_levels"], out["required_voltage"])
+        # unknown ship type or method: no demand to match, leave unscored
+        out.loc[out["voltage_reason"].isna(), matches] = np.nan
+        out["average_match"] = out[matches].mean(axis=1).round(2)
+        return out
+
+
+def read_chunks(path: str, chunksize: int = CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """Stream a CSV or Parquet file in frames of at most ``chunksize`` rows."""
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
+def _file_schema(schema):
+    """Parquet schema fixed from the first chunk.
+
+    A column with no value in that chunk has no type of its own (null, or
+    double for an empty CSV column); text columns and untyped ones are
+    written as strings so later chunks with values still cast.
+    """
+    import pyarrow as pa
+
+    fields = [
+        field.with_type(pa.string())
+        if pa.types.is_null(field.type) or (field.name in TEXT_COLUMNS and not pa.types.is_list(field.type))
+        else field
+        for field in schema
+    ]
+    return pa.schema(fields)
+
+
+class ChunkWriter:
+    """Append scored chunks to a CSV or Parquet file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._parquet = path.endswith(".parquet")
+        self._writer = None
+        self._header = True
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if self._parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, _file_schema(table.schema))
+            self._writer.write_table(table.cast(self._writer.schema))
+        else:
+            frame.to_csv(self.path, mode="w" if self._header else "a", header=self._header, index=False)
+            self._header = False
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def load_snapshot(args: argparse.Namespace) -> SheetSnapshot:
+    store = SnapshotStore(args.store)
+    if args.fixture:
+        from bluebarge.fixture import FixtureClient
+
+        return store.load_or_refresh(FixtureClient(args.fixture))
+    if args.credentials:
+        from bluebarge.auth import get_client
+
+        with open(args.credentials) as f:
+            return store.load_or_refresh(get_client(json.load(f)))
+    return store.load_stored()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="port calls, .csv or .parquet")
+    parser.add_argument("output", help="scored calls, .csv or .parquet")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--fixture", help="local JSON workbook instead of Google Sheets")
+    source.add_argument("--credentials", help="service account JSON key file")
+    parser.add_argument("--store", default=DEFAULT_PATH, help="snapshot store (used alone when offline)")
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE)
+    args = parser.parse_args(argv)
+
+    scorer = BatchScorer(load_snapshot(args))
+    writer = ChunkWriter(args.output)
+    start = time.perf_counter()
+    total = 0
+    try:
+        for chunk in read_chunks(args.input, args.chunksize):
+            writer.write(scorer.score(chunk))
+            total += len(chunk)
+            elapsed = time.perf_counter() - start
+            print(f"{total:>10,} rows  {total / elapsed:>10,.0f} rows/s", file=sys.stderr)
+    finally:
+        writer.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""Cold-start import budget for each page of the app.
+
+Every page only imports what it renders with.  The import set of each page
+is read from ``compatibility_tool.py`` itself (:func:`page_imports`): the
+imports at the top of the script, those inside a page branch, and those of
+the script's functions the code calls, following calls between them.  An
+import behind a button or checkbox only loads when the user asks for it and
+is left out.  The sets are then timed in fresh interpreters, the way a newly
+spun-up server process pays for them, and a page over its budget fails::
+
+    python -m bluebarge.coldstart [--runs 5] [--list] [--record]
+
+The budgets are the medians recorded with ``--record`` (which prints a new
+:data:`MEASURED_SECONDS`) times :data:`HEADROOM`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+SCRIPT = Path(__file__).resolve().parent.parent / "compatibility_tool.py"
+
+# page -> (top-level ``if`` test, branch holding the page)
+PAGES = {
+    "analysis": ("st.session_state.show_analysis", "body"),
+    "use_case": ("st.button('⬅️ Back to Use Case Selection')", "orelse"),
+}
+
+# widgets whose ``if`` body only runs once the user asks for it
+ON_DEMAND_WIDGETS = {"button", "checkbox", "toggle", "form_submit_button"}
+
+# seconds, median of 5 fresh-interpreter runs (--record), 2026-10-18:
+# Python 3.11.7, streamlit 1.65.0, 1 vCPU Linux container
+MEASURED_SECONDS: Dict[str, float] = {
+    "common": 0.41,
+    "analysis": 0.63,
+    "use_case": 0.62,
+}
+
+# run-to-run noise was about 0.02 s; scipy on the analysis page adds 0.15 s
+HEADROOM = 1.15
+
+_PROBE = """
+import importlib, sys, time
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    importlib.import_module(name)
+print(time.perf_counter() - start)
+"""
+
+
+def _modules(node: ast.AST) -> List[str]:
+    if isinstance(node, ast.Import):
+        return [alias.name for alias in node.names]
+    if isinstance(node, ast.ImportFrom) and node.module and node.module != "__future__":
+        return [node.module]
+    return []
+
+
+def _on_demand(node: ast.AST) -> bool:
+    test = node.test if isinstance(node, ast.If) else None
+    return (
+        isinstance(test, ast.Call)
+        and isinstance(test.func, ast.Attribute)
+        and test.func.attr in ON_DEMAND_WIDGETS
+    )
+
+
+class _Collector:
+    """Imports reachable from some statements, through the script's functions."""
+
+    def __init__(self, functions: Dict[str, ast.FunctionDef]):
+        self.functions = functions
+        self.modules: List[str] = []
+        self._visited: Set[str] = set()
+
+    def visit(self, nodes: Iterable[ast.AST]) -> None:
+        for node in nodes:
+            self._visit(node)
+
+    def _visit(self, node: ast.AST) -> None:
+        if _on_demand(node):
+            self.visit(node.orelse)  # only the body waits for the user
+            self._visit(node.test)
+            return
+        for name in _modules(node):
+            if name not in self.modules:
+                self.modules.append(name)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            name = node.func.id
+            if name in self.functions and name not in self._visited:
+                self._visited.add(name)
+                self.visit(self.functions[name].body)
+        for child in ast.iter_child_nodes(node):
+            self._visit(child)
+
+
+def page_imports(script: Path = SCRIPT) -> Dict[str, List[str]]:
+    """Modules each page imports, ``common`` (the top of the script) included."""
+    tree = ast.parse(script.read_text(encoding="utf-8"))
+    functions = {n.name: n for n in tree.body if isinstance(n, ast.FunctionDef)}
+    branches = {}
+    for node in tree.body:
+        if isinstance(node, ast.If):
+            for page, (test, branch) in PAGES.items():
+                if ast.unparse(node.test) == test:
+                    branches[page] = (node, getattr(node, branch))
+    missing = set(PAGES) - set(branches)
+    if missing:
+        raise LookupError(f"page branch not found in {script.name}: {', '.join(sorted(missing))}")
+
+    page_nodes = {id(node) for node, _ in branches.values()}
+    common = _Collector(functions)
+    common.visit(
+        n for n in tree.body if id(n) not in page_nodes and not isinstance(n, ast.FunctionDef)
+    )
+    imports = {"common": common.modules}
+    for page, (_, body) in branches.items():
+        collector = _Collector(functions)
+        collector.modules = list(common.modules)
+        collector.visit(body)
+        imports[page] = collector.modules
+    return imports
+
+
+def measure(modules: List[str]) -> float:
+    """Seconds a fresh interpreter spends importing ``modules``."""
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE, *modules],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="runs per page (median is used)")
+    parser.add_argument("--record", action="store_true", help="print the medians as MEASURED_SECONDS")
+    parser.add_argument("--list", action="store_true", help="print each page's import set")
+    args = parser.parse_args(argv)
+
+    over = False
+    measured = {}
+    for page, modules in page_imports().items():
+        if args.list:
+            print(f"{page}: {' '.join(modules)}")
+        try:
+            seconds = statistics.median(measure(modules) for _ in range(args.runs))
+        except subprocess.CalledProcessError as e:
+            print(f"{page:<10} import failed: {e.stderr.strip().splitlines()[-1]}")
+            over = True
+            continue
+        measured[page] = round(seconds, 2)
+        budget = MEASURED_SECONDS.get(page, 0.0) * HEADROOM
+        status = "ok" if seconds <= budget else "OVER BUDGET"
+        over |= seconds > budget
+        print(f"{page:<10} {seconds:6.2f} s  (budget {budget:.2f} s)  {status}")
+    if args.record:
+        print("MEASURED_SECONDS = {")
+        for page, seconds in measured.items():
+            print(f'    "{page}": {seconds},')
+        print("}")
+        return 0
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Hard-parameter compatibility between ship types and port equipment.
+
+The rules are the ones of the "Port and Ship Equipment Compatibility"
+section: the equipment plug type matches the ship's plug type, barge service
+is offered, and the voltage level and IEC standard match the connection
+voltage.  :func:`compatibility_matrix` evaluates them for every ship type x
+voltage x port combination at once.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from bluebarge.scoring import VOLTAGE_STANDARDS, expected_plug_type
+
+VOLTAGES = ("HV", "LV")
+
+
+def _lower(series: pd.Series) -> np.ndarray:
+    return series.astype(str).str.lower().to_numpy()
+
+
+def _upper(series: pd.Series) -> np.ndarray:
+    return series.astype(str).str.upper().to_numpy()
+
+
+@dataclass(frozen=True)
+class CompatibilityMatrix:
+    ship_types: Tuple[str, ...]
+    voltages: Tuple[str, ...]
+    ports: Tuple[str, ...]
+    counts: np.ndarray  # int, ship types x voltages x ports
+    compatible: np.ndarray  # bool, ship types x voltages x ports
+
+    def port_counts(self, ship_type: str, voltage: str) -> pd.Series:
+        """Compatible equipment per port for one ship type and voltage."""
+        s = self.ship_types.index(ship_type)
+        v = self.voltages.index(voltage)
+        return pd.Series(self.counts[s, v], index=list(self.ports), name="compatible_equipment")
+
+    def to_frame(self) -> pd.DataFrame:
+        """Long format: one row per ship type, voltage and port."""
+        index = pd.MultiIndex.from_product(
+            [self.ship_types, self.voltages, self.ports], names=["ship_type", "voltage", "Port"]
+        )
+        return pd.DataFrame(
+            {"compatible_equipment": self.counts.ravel(), "compatible": self.compatible.ravel()},
+            index=index,
+        ).reset_index()
+
+
+def compatibility_matrix(
+    equipment: pd.DataFrame,
+    ship_types: Sequence[str],
+    voltages: Sequence[str] = VOLTAGES,
+) -> CompatibilityMatrix:
+    """Count compatible equipment for every ship type x voltage x port."""
+    equipment = equipment[equipment["Port"].notna() & (equipment["Port"].astype(str) != "")]
+    port_codes, ports = pd.factorize(equipment["Port"])
+
+    # plug types: encode equipment and expected values on one code book
+    expected = [expected_plug_type(ship).lower() for ship in ship_types]
+    plug_codes, _ = pd.factorize(
+        np.concatenate([_lower(equipment["Plug Type"]), np.asarray(expected, dtype=object)])
+    )
+    equipment_plugs, ship_plugs = plug_codes[: len(equipment)], plug_codes[len(equipment) :]
+    plug_match = ship_plugs[:, None] == equipment_plugs[None, :]  # S x E
+
+    barge = _lower(equipment["Barge Service"]) == "yes"  # E
+    levels = _upper(equipment["Voltage Level"])
+    standards = _upper(equipment["Standard (IEC)"])
+    voltage_ok = np.zeros((len(voltages), len(equipment)), dtype=bool)  # V x E
+    for v, voltage in enumerate(voltages):
+        standard = VOLTAGE_STANDARDS.get(voltage, "").upper()
+        voltage_ok[v] = (levels == voltage) & (standards == standard) & barge
+
+    match = plug_match[:, None, :] & voltage_ok[None, :, :]  # S x V x E
+    # count the matching rows per (ship type, voltage) and port code
+    combo, rows = np.nonzero(match.reshape(-1, len(equipment)))
+    counts = np.bincount(
+        combo * len(ports) + port_codes[rows], minlength=len(ship_types) * len(voltages) * len(ports)
+    ).reshape(len(ship_types), len(voltages), len(ports))
+
+    return CompatibilityMatrix(
+        ship_types=tuple(ship_types),
+        voltages=tuple(voltages),
+        ports=tuple(ports),
+        counts=counts,
+        compatible=counts > 0,
+    )
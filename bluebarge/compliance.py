@@ -0,0 +1,159 @@
+"""Weather compliance over the whole hourly forecast.
+
+Every threshold in the "Weather Thresholds" worksheet is checked against
+every forecast hour in one vectorized pass (a value passes when it is at or
+below its threshold, missing values fail).  Hours where all thresholds pass
+are run-length encoded into contiguous feasible connection windows.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Tuple
+
+import numpy as np
+import pandas as pd
+
+from bluebarge.timeseries import Instant, parse_hourly, to_epoch
+
+# "Weather Thresholds" Parameter -> Open-Meteo hourly variable
+THRESHOLD_VARIABLES = {
+    "wave_height": "wave_height",
+    "wind_speed": "wind_speed_10m",
+}
+
+HOUR = 3600
+
+
+def threshold_variable(parameter: str) -> str:
+    """Open-Meteo variable for a threshold parameter (identity if unknown)."""
+    return THRESHOLD_VARIABLES.get(parameter, parameter)
+
+
+def align_hourly(*hourly_blocks: Mapping[str, Any]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Merge several ``hourly`` blocks onto the hours they all share."""
+    epochs = None
+    series: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    for hourly in hourly_blocks:
+        block_epochs, values = parse_hourly(hourly)
+        epochs = block_epochs if epochs is None else np.intersect1d(epochs, block_epochs)
+        for var, vals in values.items():
+            series[var] = (block_epochs, vals)
+    if epochs is None:
+        return np.empty(0, dtype=np.int64), {}
+    aligned = {
+        var: vals[np.searchsorted(block_epochs, epochs)]
+        for var, (block_epochs, vals) in series.items()
+    }
+    return epochs, aligned
+
+
+def run_length_windows(epochs: np.ndarray, mask: np.ndarray) -> pd.DataFrame:
+    """Contiguous ``True`` runs of an hourly mask as start/end/duration rows.
+
+    ``mask`` may be 2-D (locations x hours); the windows of every row are then
+    found in the same pass and tagged with a ``location`` row index.
+    """
+    mask = np.atleast_2d(mask)
+    padded = np.zeros((mask.shape[0], mask.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    # row-major order keeps the n-th start paired with the n-th stop
+    locations, starts = np.nonzero(edges == 1)
+    _, stops = np.nonzero(edges == -1)
+    windows = pd.DataFrame(
+        {
+            "start": pd.to_datetime(epochs[starts], unit="s", utc=True),
+            "end": pd.to_datetime(epochs[stops - 1] + HOUR, unit="s", utc=True),
+            "duration_h": stops - starts,
+        }
+    )
+    if mask.shape[0] > 1:
+        windows.insert(0, "location", locations)
+    return windows
+
+
+@dataclass(frozen=True)
+class ComplianceResult:
+    epochs: np.ndarray  # hourly UTC epoch seconds
+    parameters: List[str]  # threshold parameters that were evaluated
+    passed: np.ndarray  # bool, parameters x hours
+    windows: pd.DataFrame  # start, end (exclusive), duration_h
+    skipped: List[str] = field(default_factory=list)  # no matching series
+
+    @property
+    def feasible(self) -> np.ndarray:
+        return self.passed.all(axis=0)
+
+
+def evaluate(
+    thresholds: pd.DataFrame, *hourly_blocks: Mapping[str, Any], now: Instant = None
+) -> ComplianceResult:
+    """Check every threshold against every hour from ``now`` onwards.
+
+    ``thresholds`` is the "Weather Thresholds" frame indexed by Parameter
+    with a ``Threshold`` column.  Hours before the current one are dropped.
+    """
+    epochs, values = align_hourly(*hourly_blocks)
+    keep = epochs >= to_epoch(now) // HOUR * HOUR
+    epochs = epochs[keep]
+
+    parameters, skipped, limits, rows = [], [], [], []
+    for parameter, limit in thresholds["Threshold"].items():
+        var = threshold_variable(str(parameter))
+        if var not in values:
+            skipped.append(parameter)
+            continue
+        parameters.append(parameter)
+        limits.append(float(limit))
+        rows.append(values[var][keep])
+
+    if rows:
+        # NaN compares False, so missing hours fail
+        passed = np.vstack(rows) <= np.asarray(limits)[:, None]
+    else:
+        passed = np.zeros((0, len(epochs)), dtype=bool)
+    feasible = passed.all(axis=0) if rows else np.zeros(len(epochs), dtype=bool)
+    return ComplianceResult(
+        epochs=epochs,
+        parameters=parameters,
+        passed=passed,
+        windows=run_length_windows(epochs, feasible),
+        skipped=skipped,
+    )
+
+
+def evaluate_fleet(
+    thresholds: pd.DataFrame,
+    epochs: np.ndarray,
+    values: Mapping[str, np.ndarray],
+    now: Instant = None,
+) -> Tuple[np.ndarray, np.ndarray, pd.DataFrame]:
+    """Fleet version of :func:`evaluate` over ``locations x hours`` arrays.
+
+    Returns ``(epochs, feasible, windows)`` where ``feasible`` is a
+    ``locations x hours`` bool array and ``windows`` has a ``location``
+    column with the row index of each window.
+    """
+    keep = epochs >= to_epoch(now) // HOUR * HOUR
+    epochs = epochs[keep]
+    n_locations = next(iter(values.values())).shape[0] if values else 0
+    feasible = np.ones((n_locations, len(epochs)), dtype=bool)
+    evaluated = False
+    for parameter, limit in thresholds["Threshold"].items():
+        var = threshold_variable(str(parameter))
+        if var in values:
+            feasible &= values[var][:, keep] <= float(limit)
+            evaluated = True
+    if not evaluated:
+        feasible[:] = False
+
+    windows = run_length_windows(epochs, feasible)
+    if "location" not in windows.columns:
+        windows.insert(0, "location", np.zeros(len(windows), dtype=int))
+    return epochs, feasible, windows
+
+
+def windows_for_stay(windows: pd.DataFrame, hours: float) -> pd.DataFrame:
+    """Windows long enough for a stay of ``hours`` (e.g. ``avg_time_h``)."""
+    return windows[windows["duration_h"] >= hours]
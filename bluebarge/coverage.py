@@ -0,0 +1,60 @@
+"""Share of annual port calls a barge power/energy spec fully covers.
+
+A call is covered when the barge power and energy are at least the ship
+type's demand under the estimation method (see :mod:`bluebarge.demand`);
+calls are weighted by ``port_calls (no.)``.  For a whole grid of specs at
+once, each ship type's demand is binned to the first grid point that covers it
+(:func:`numpy.searchsorted`), the call weights are accumulated per bin
+(:func:`numpy.add.at`) and cumulative sums along both axes give the covered
+share of every grid point.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+from bluebarge.demand import DemandTable
+from bluebarge.scoring import METHODS
+
+
+@dataclass(frozen=True)
+class CoverageGrid:
+    power_mw: np.ndarray  # P, ascending
+    energy_mwh: np.ndarray  # E, ascending
+    share: Dict[str, np.ndarray]  # method -> P x E covered share of calls
+
+    def to_frame(self, method: str) -> pd.DataFrame:
+        return pd.DataFrame(
+            self.share[method],
+            index=pd.Index(self.power_mw, name="power_mw"),
+            columns=pd.Index(self.energy_mwh, name="energy_mwh"),
+        )
+
+
+def coverage_grid(
+    demand: DemandTable,
+    power_grid: Sequence[float],
+    energy_grid: Sequence[float],
+    methods: Sequence[str] = METHODS,
+) -> CoverageGrid:
+    """Covered share of weighted calls for every power x energy grid point."""
+    power_grid = np.unique(np.asarray(power_grid, dtype=float))
+    energy_grid = np.unique(np.asarray(energy_grid, dtype=float))
+
+    share = {}
+    for method in methods:
+        ships = demand.for_method(method)
+        weights = pd.to_numeric(ships["port_calls (no.)"], errors="coerce").fillna(0).to_numpy(float)
+        total = weights.sum()
+        # first grid point at or above the demand; len(grid) = never covered
+        p = np.searchsorted(power_grid, ships["required_power_mw"].to_numpy(float), side="left")
+        e = np.searchsorted(energy_grid, ships["required_energy_mwh"].to_numpy(float), side="left")
+        binned = np.zeros((len(power_grid) + 1, len(energy_grid) + 1))
+        np.add.at(binned, (p, e), weights)
+        covered = binned[:-1, :-1].cumsum(axis=0).cumsum(axis=1)
+        share[method] = covered / total if total else covered
+    return CoverageGrid(power_grid, energy_grid, share)
@@ -0,0 +1,73 @@
+"""Ship Demand resolved for every ship type and estimation method.
+
+Built once per snapshot from the "Ship Demand" and "Voltage Compatibility"
+worksheets: one row per ship type x method with power and energy (the
+"Average" method already averaged), the voltages the ship supports, the
+voltage the HV rule enforces, and the connection voltage and IEC standard
+to use.  Pages and batch jobs then do a keyed lookup instead of re-deriving
+these on every rerun or row.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pandas as pd
+
+from bluebarge.scoring import METHODS, decide_voltage, demand_for_method, standard_for_voltage
+
+# voltage used when a ship supports both and the HV rule leaves the choice
+# open (the app's voltage radio defaults to the first option)
+DEFAULT_CHOICE = "HV"
+
+# Ship Demand columns carried along unchanged
+CARRIED_COLUMNS = ("avg_time_h", "port_calls (no.)", "gt")
+
+
+@dataclass(frozen=True)
+class DemandTable:
+    frame: pd.DataFrame  # indexed by (ship_type, method)
+
+    def lookup(self, ship_type: str, method: str) -> pd.Series:
+        """The resolved demand of one ship type under one method."""
+        return self.frame.loc[(ship_type, method)]
+
+    def for_method(self, method: str) -> pd.DataFrame:
+        """One row per ship type, ``ship_type`` as a column."""
+        return self.frame.xs(method, level="method").reset_index()
+
+
+def build_demand_table(
+    ship_demand: pd.DataFrame, voltage_compatibility: pd.DataFrame
+) -> DemandTable:
+    """Resolve every ship type x method (first row wins for duplicate ship types)."""
+    support = voltage_compatibility.drop_duplicates("ship_type").set_index("ship_type")
+    rows = []
+    for _, ship in ship_demand.drop_duplicates("ship_type").iterrows():
+        ship_type = ship["ship_type"]
+        supports_hv = ship_type in support.index and support.at[ship_type, "supports HV"] == "Yes"
+        supports_lv = ship_type in support.index and support.at[ship_type, "supports LV"] == "Yes"
+        carried = {column: ship[column] for column in CARRIED_COLUMNS if column in ship.index}
+        for method in METHODS:
+            power, energy = demand_for_method(ship, method)
+            decision = decide_voltage(supports_hv, supports_lv, power)
+            voltage = DEFAULT_CHOICE if decision.reason == "choice" else decision.voltage
+            rows.append(
+                {
+                    "ship_type": ship_type,
+                    "method": method,
+                    "required_power_mw": power,
+                    "required_energy_mwh": energy,
+                    "supports_hv": supports_hv,
+                    "supports_lv": supports_lv,
+                    "voltage_reason": decision.reason,
+                    "voltage_options": decision.options,
+                    "enforced_voltage": decision.voltage,
+                    "required_voltage": voltage,
+                    "required_standard": standard_for_voltage(voltage),
+                    **carried,
+                }
+            )
+    columns = ["ship_type", "method"]
+    frame = pd.DataFrame(rows, columns=rows[0].keys() if rows else columns)
+    return DemandTable(frame.set_index(columns))
@@ -0,0 +1,130 @@
+"""Inverted attribute index over the "Equipment List" worksheet.
+
+Built once per snapshot: every normalized attribute value (plug type, voltage
+level, IEC standard, barge service) maps to a packed bitset of the rows that
+carry it.  Finding compatible equipment is then an AND of a few precomputed
+bitsets instead of a rescan of the frame with string operations.
+
+Ports have one value per port, and a bitset per value would grow as ports x
+rows / 8; they keep their rows as slices of one port-sorted row order
+instead, and a port's bitset is packed only when asked for.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# attribute -> (Equipment List column, normalization)
+ATTRIBUTES = {
+    "port": ("Port", None),
+    "plug": ("Plug Type", "lower"),
+    "voltage": ("Voltage Level", "upper"),
+    "standard": ("Standard (IEC)", "upper"),
+    "barge": ("Barge Service", "lower"),
+}
+
+# attributes kept as row lists (one sorted slice per value) instead of bitsets
+ROW_LIST_ATTRIBUTES = ("port",)
+
+
+def _normalize(value, how: Optional[str]):
+    if how is None or not isinstance(value, str):
+        return value
+    return value.lower() if how == "lower" else value.upper()
+
+
+class EquipmentIndex:
+    """Attribute value -> packed row bitset, for constant-time matching."""
+
+    def __init__(
+        self,
+        n_rows: int,
+        bits: Dict[str, Dict[object, np.ndarray]],
+        codes: Dict[str, Tuple[np.ndarray, List[object]]],
+        row_lists: Dict[str, Tuple[np.ndarray, np.ndarray, Dict[object, int]]],
+    ):
+        self.n_rows = n_rows
+        self._bits = bits
+        self._codes = codes
+        self._row_lists = row_lists
+        self._empty = np.zeros((n_rows + 7) // 8, dtype=np.uint8)
+        self._all = np.packbits(np.ones(n_rows, dtype=bool))
+
+    @classmethod
+    def from_frame(cls, equipment: pd.DataFrame) -> "EquipmentIndex":
+        n = len(equipment)
+        bits: Dict[str, Dict[object, np.ndarray]] = {}
+        codes_by_attr: Dict[str, Tuple[np.ndarray, List[object]]] = {}
+        row_lists: Dict[str, Tuple[np.ndarray, np.ndarray, Dict[object, int]]] = {}
+        for attr, (column, how) in ATTRIBUTES.items():
+            bits[attr] = {}
+            codes_by_attr[attr] = (np.full(n, -1, dtype=np.intp), [])
+            if column not in equipment.columns:
+                continue
+            values = equipment[column]
+            if how is not None:
+                values = values.astype(str).str.lower() if how == "lower" else values.astype(str).str.upper()
+            codes, uniques = pd.factorize(values)
+            codes_by_attr[attr] = (codes, list(uniques))
+            order = np.argsort(codes, kind="stable")
+            bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            if attr in ROW_LIST_ATTRIBUTES:
+                # rows of value k: order[bounds[k] : bounds[k + 1]], ascending
+                row_lists[attr] = (order, bounds, {value: k for k, value in enumerate(uniques)})
+                continue
+            for k, value in enumerate(uniques):
+                mask = np.zeros(n, dtype=bool)
+                mask[order[bounds[k] : bounds[k + 1]]] = True
+                bits[attr][value] = np.packbits(mask)
+        return cls(n, bits, codes_by_attr, row_lists)
+
+    def value_rows(self, attr: str, value) -> np.ndarray:
+        """Row positions whose ``attr`` equals ``value``, ascending."""
+        if attr not in ROW_LIST_ATTRIBUTES:
+            return self.rows(self.bitset(attr, value))
+        if attr not in self._row_lists:
+            return np.zeros(0, dtype=np.intp)
+        order, bounds, position = self._row_lists[attr]
+        k = position.get(_normalize(value, ATTRIBUTES[attr][1]))
+        if k is None:
+            return np.zeros(0, dtype=np.intp)
+        return order[bounds[k] : bounds[k + 1]]
+
+    def bitset(self, attr: str, value) -> np.ndarray:
+        """Rows whose ``attr`` equals ``value`` (normalized like the index)."""
+        if attr in ROW_LIST_ATTRIBUTES:
+            mask = np.zeros(self.n_rows, dtype=bool)
+            mask[self.value_rows(attr, value)] = True
+            return np.packbits(mask)
+        how = ATTRIBUTES[attr][1]
+        return self._bits[attr].get(_normalize(value, how), self._empty)
+
+    def match(self, **criteria) -> np.ndarray:
+        """AND of the bitsets for ``attr=value`` criteria (all rows if none)."""
+        result = self._all
+        for attr, value in criteria.items():
+            result = np.bitwise_and(result, self.bitset(attr, value))
+        return result
+
+    def rows(self, bits: np.ndarray) -> np.ndarray:
+        """Row positions set in ``bits``."""
+        return np.flatnonzero(np.unpackbits(bits, count=self.n_rows))
+
+    def flags(self, bits: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Whether each of ``rows`` is set in ``bits``."""
+        return np.unpackbits(bits, count=self.n_rows)[rows].astype(bool)
+
+    def values(self, attr: str) -> List[object]:
+        """Distinct normalized values of an attribute."""
+        return self._codes[attr][1]
+
+    def codes(self, attr: str) -> np.ndarray:
+        """Per-row position of the value in :meth:`values` (-1 if missing)."""
+        return self._codes[attr][0]
+
+    def mask(self, bits: np.ndarray) -> np.ndarray:
+        """``bits`` unpacked into one bool per row."""
+        return np.unpackbits(bits, count=self.n_rows).astype(bool)
@@ -0,0 +1,98 @@
+"""Local JSON workbook that stands in for gspread when working offline.
+
+A fixture file looks like::
+
+    {
+        "title": "Bluebarge_Comp_Texts",
+        "worksheets": {
+            "Use Cases": [["umbrella_name", "use_case_name", ...], [...]],
+            "Equipment List": [["Port", "Type", ...], [...]],
+            ...
+        }
+    }
+
+Worksheets keep their file order, so the first one plays the role of
+``sheet1``.  The file's mtime is reported as the Drive ``modifiedTime``, so
+editing the fixture triggers a refresh in :class:`bluebarge.store.SnapshotStore`
+exactly like editing the real spreadsheet would.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from bluebarge.sheets import SPREADSHEET_TITLE, WORKSHEETS, Rows, fetch_values
+
+
+class FixtureWorksheet:
+    def __init__(self, title: str):
+        self.title = title
+
+
+class FixtureSpreadsheet:
+    """The subset of :class:`gspread.Spreadsheet` the snapshot loader uses."""
+
+    def __init__(self, title: str, worksheets: Dict[str, Rows]):
+        self.id = self.title = title
+        self._worksheets = worksheets
+
+    def worksheets(self) -> List[FixtureWorksheet]:
+        return [FixtureWorksheet(title) for title in self._worksheets]
+
+    def values_batch_get(self, ranges: List[str], params: Any = None) -> Dict[str, Any]:
+        value_ranges = []
+        for a1 in ranges:
+            title = a1.split("!")[0]
+            if title.startswith("'") and title.endswith("'"):
+                title = title[1:-1].replace("''", "'")
+            value_ranges.append({"range": a1, "values": self._worksheets[title]})
+        return {"valueRanges": value_ranges}
+
+
+class FixtureClient:
+    """The subset of :class:`gspread.Client` the snapshot loader uses."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _load(self) -> Dict[str, Any]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def list_spreadsheet_files(self, title: str = None) -> List[Dict[str, str]]:
+        workbook_title = self._load().get("title", SPREADSHEET_TITLE)
+        if title is not None and title != workbook_title:
+            return []
+        mtime = datetime.fromtimestamp(os.path.getmtime(self.path), tz=timezone.utc)
+        return [
+            {
+                "id": workbook_title,
+                "name": workbook_title,
+                "modifiedTime": mtime.isoformat(timespec="milliseconds"),
+            }
+        ]
+
+    def open(self, title: str) -> FixtureSpreadsheet:
+        workbook = self._load()
+        if workbook.get("title", SPREADSHEET_TITLE) != title:
+            raise LookupError(f"Spreadsheet {title!r} not found in {self.path}")
+        return FixtureSpreadsheet(title, workbook["worksheets"])
+
+    def open_by_key(self, key: str) -> FixtureSpreadsheet:
+        return self.open(key)
+
+
+def export_fixture(client, path: str, title: str = SPREADSHEET_TITLE) -> None:
+    """Write the live spreadsheet to ``path`` as a fixture file."""
+    spreadsheet = client.open(title)
+    values = fetch_values(spreadsheet)
+    titles = [ws.title for ws in spreadsheet.worksheets()]
+    worksheets = {titles[0]: values["use_cases"]}
+    for field, sheet_title in WORKSHEETS.items():
+        if sheet_title is not None:
+            worksheets[sheet_title] = values[field]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"title": title, "worksheets": worksheets}, f, ensure_ascii=False, indent=1)
@@ -0,0 +1,127 @@
+"""Pareto frontier of candidate barge designs.
+
+Candidates (power, energy, supported standards and voltage levels, and a
+cost proxy) are scored against every ship type's demand with the sample
+match rules (see :func:`bluebarge.assignment.score_matrix`).  The
+non-dominated set is then found with a sort and a running minimum in two
+dimensions (O(n log n)) and with sort-filter-skyline in more: after sorting
+by a monotone function of the objectives no point can be dominated by a
+later one, so candidates are only compared, a block at a time, against the
+skyline found so far.
+
+All objectives are minimized; negate the ones to maximize.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from bluebarge.assignment import score_matrix
+
+# candidates compared against the skyline per vectorized step
+SKYLINE_BLOCK = 512
+
+
+def design_scores(candidates: pd.DataFrame, demand: pd.DataFrame) -> np.ndarray:
+    """N x S match score (percent) of every candidate for every demand row."""
+    scores, _ = score_matrix(candidates, demand)
+    return scores
+
+
+def pareto_2d(objectives: np.ndarray) -> np.ndarray:
+    """Mask of the non-dominated rows of an N x 2 array (both minimized)."""
+    objectives = np.asarray(objectives, dtype=float)
+    order = np.lexsort((objectives[:, 1], objectives[:, 0]))
+    second = objectives[order, 1]
+    best_before = np.concatenate(([np.inf], np.minimum.accumulate(second)[:-1]))
+    mask = np.zeros(len(objectives), dtype=bool)
+    mask[order] = second < best_before
+    return mask
+
+
+def _dominated(window: np.ndarray, points: np.ndarray, block: int = SKYLINE_BLOCK) -> np.ndarray:
+    """Which of ``points`` some other row of ``window`` dominates.
+
+    Rows are distinct, so a row that is ``<=`` everywhere dominates.  The
+    window is walked in slices and points are dropped as soon as one
+    dominates them, so most points only meet the first (strongest) slice.
+    """
+    dominated = np.zeros(len(points), dtype=bool)
+    for start in range(0, len(window), block):
+        alive = np.flatnonzero(~dominated)
+        if not len(alive):
+            break
+        part = window[start : start + block]
+        le = np.all(part[None, :, :] <= points[alive, None, :], axis=2)
+        if window is points:  # a point does not dominate itself
+            le[alive[:, None] == np.arange(start, start + len(part))[None, :]] = False
+        dominated[alive] = le.any(axis=1)
+    return dominated
+
+
+def skyline(objectives: np.ndarray, block: int = SKYLINE_BLOCK) -> np.ndarray:
+    """Mask of the non-dominated rows of an N x D array (all minimized)."""
+    objectives = np.asarray(objectives, dtype=float)
+    n, d = objectives.shape
+    if d == 2:
+        return pareto_2d(objectives)
+    # identical points share one verdict: run on the distinct rows only
+    points, first = np.unique(objectives, axis=0, return_index=True)
+
+    # sort-filter-skyline: the sum of min-max normalized objectives is
+    # monotone, so no point is dominated by one sorted after it
+    low, high = points.min(axis=0), points.max(axis=0)
+    span = np.where(high > low, high - low, 1.0)
+    order = np.argsort(((points - low) / span).sum(axis=1), kind="stable")
+    points, first = points[order], first[order]
+
+    # the skyline of the first (strongest) block usually dominates most of
+    # the rest: drop those in one vectorized pass before the block loop
+    head = points[:block]
+    head = head[~_dominated(head, head)]
+    alive = np.ones(len(points), dtype=bool)
+    alive[block:] = ~_dominated(head, points[block:])
+    points, first = points[alive], first[alive]
+
+    # blocks of points are filtered against the skyline so far, then among
+    # themselves (domination is transitive, so any dominating block member
+    # will do)
+    window = np.empty((0, d))
+    keep = []
+    for start in range(0, len(points), block):
+        chunk = points[start : start + block]
+        alive = ~_dominated(window, chunk)
+        chunk, index = chunk[alive], np.flatnonzero(alive) + start
+        alive = ~_dominated(chunk, chunk)
+        window = np.vstack([window, chunk[alive]])
+        keep.extend(index[alive])
+    mask = np.zeros(n, dtype=bool)
+    mask[first[keep]] = True  # first occurrence of each skyline point
+    return mask
+
+
+def pareto_designs(
+    candidates: pd.DataFrame,
+    demand: pd.DataFrame,
+    weights: Optional[np.ndarray] = None,
+    per_ship_type: bool = False,
+) -> pd.DataFrame:
+    """Non-dominated candidates, with their scores.
+
+    By default the objectives are the (``weights``, e.g. port calls,
+    weighted) mean score over all demand rows against ``cost``; with
+    ``per_ship_type`` every demand row is an objective of its own.
+    """
+    scores = design_scores(candidates, demand)
+    mean_score = np.average(scores, axis=1, weights=weights)
+    cost = candidates["cost"].to_numpy(float)
+    if per_ship_type:
+        mask = skyline(np.column_stack([-scores, cost]))
+    else:
+        mask = pareto_2d(np.column_stack([-mean_score, cost]))
+    result = candidates.reset_index(drop=True).copy()
+    result["mean_score"] = mean_score.round(2)
+    return result[mask].sort_values("cost", ignore_index=True)
@@ -0,0 +1,53 @@
+"""Port level views of the "Equipment List" worksheet."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+LAT_COLUMNS = ("Latitude", "Lat", "latitude", "lat")
+LON_COLUMNS = ("Longitude", "Lon", "Lng", "longitude", "lon", "lng")
+
+
+def _find_column(frame: pd.DataFrame, candidates) -> str:
+    for name in candidates:
+        if name in frame.columns:
+            return name
+    return ""
+
+
+def port_coordinates(equipment: pd.DataFrame) -> pd.DataFrame:
+    """One ``Port, lat, lon`` row per port that has coordinates.
+
+    Coordinates are read from Latitude/Longitude style columns of the
+    Equipment List; the first valid pair listed for a port wins.  Ports
+    without coordinates are left out.
+    """
+    lat_col = _find_column(equipment, LAT_COLUMNS)
+    lon_col = _find_column(equipment, LON_COLUMNS)
+    if not lat_col or not lon_col or "Port" not in equipment.columns:
+        return pd.DataFrame(columns=["Port", "lat", "lon"])
+
+    coords = pd.DataFrame(
+        {
+            "Port": equipment["Port"],
+            "lat": pd.to_numeric(equipment[lat_col], errors="coerce"),
+            "lon": pd.to_numeric(equipment[lon_col], errors="coerce"),
+        }
+    )
+    coords = coords[(coords["Port"].astype(str).str.strip() != "") & coords["Port"].notna()]
+    coords = coords.dropna(subset=["lat", "lon"])
+    return coords.drop_duplicates("Port").reset_index(drop=True)
+
+
+def parse_anchorages(text: str) -> pd.DataFrame:
+    """Parse ``name, lat, lon`` lines typed by the user; bad lines are skipped."""
+    rows = []
+    for line in text.splitlines():
+        parts = [part.strip() for part in line.split(",")]
+        if len(parts) != 3:
+            continue
+        try:
+            rows.append({"Port": parts[0], "lat": float(parts[1]), "lon": float(parts[2])})
+        except ValueError:
+            continue
+    return pd.DataFrame(rows, columns=["Port", "lat", "lon"])
@@ -0,0 +1,104 @@
+"""Rank every port for one ship demand profile.
+
+Ports are ordered by how many pieces of equipment are fully compatible (plug
+type, barge service, voltage and standard all match), then by a capacity
+score and then by how many of those four checks their best equipment meets.
+
+The capacity score is the power/energy cover of the best compatible
+equipment, weighted by the Analysis sheet's ``Port Power Capacity`` and
+``Port Energy Capacity`` default weights (:func:`capacity_weights`).  It
+reads the Equipment List column named like the parameter; the sheet has no
+such columns today, and without one the score is left out (NaN) rather than
+made up.  Everything else works on the precomputed :class:`EquipmentIndex`
+arrays, so a re-rank on each widget change costs a few vector operations.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from bluebarge.equipment_index import EquipmentIndex
+from bluebarge.scoring import cover_share
+
+# criterion -> (Analysis parameter / Equipment List column, uc_demand key)
+CAPACITY_CRITERIA = {
+    "power": ("Port Power Capacity", "required_power_mw"),
+    "energy": ("Port Energy Capacity", "required_energy_mwh"),
+}
+
+
+def capacity_weights(param_config: pd.DataFrame) -> Dict[str, float]:
+    """Capacity criterion -> default weight of its Analysis-sheet parameter."""
+    names = param_config["Name"].astype(str).str.strip().str.lower()
+    weights = pd.to_numeric(param_config["Default Weight"], errors="coerce")
+    weights = dict(zip(names, weights))
+    return {
+        criterion: float(weights[column.lower()])
+        for criterion, (column, _) in CAPACITY_CRITERIA.items()
+        if column.lower() in weights and weights[column.lower()] > 0
+    }
+
+
+def rank_ports(
+    index: EquipmentIndex,
+    uc_demand: Mapping[str, object],
+    plug_type: str,
+    top_k: Optional[int] = None,
+    weights: Optional[Mapping[str, float]] = None,
+    equipment: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Ports ranked by compatible equipment count, capacity score and checks met.
+
+    ``weights`` are the capacity weights (:func:`capacity_weights`) and
+    ``equipment`` the frame the index was built from; criteria without a
+    weight or a column are left out and the remaining weights rescaled.
+    """
+    checks = [
+        index.mask(index.bitset("plug", plug_type)),
+        index.mask(index.bitset("barge", "yes")),
+        index.mask(index.bitset("voltage", uc_demand.get("required_voltage"))),
+        index.mask(index.bitset("standard", uc_demand.get("required_standard"))),
+    ]
+    hard = np.logical_and.reduce(checks)
+    checks_met = np.sum(checks, axis=0)
+
+    covers, w = [], []
+    for criterion, (column, key) in CAPACITY_CRITERIA.items():
+        weight = (weights or {}).get(criterion, 0.0)
+        if weight > 0 and equipment is not None and column in equipment.columns:
+            capacity = pd.to_numeric(equipment[column], errors="coerce").to_numpy(float)
+            # missing capacities cover nothing
+            covers.append(cover_share(np.nan_to_num(capacity), float(uc_demand.get(key) or 0)))
+            w.append(weight)
+
+    codes = index.codes("port")
+    ports = index.values("port")
+    valid = codes >= 0
+    compatible = valid & hard
+    counts = np.bincount(codes[compatible], minlength=len(ports))
+    best_checks = np.zeros(len(ports), dtype=np.int64)
+    np.maximum.at(best_checks, codes[valid], checks_met[valid])
+
+    if w:
+        row_score = np.vstack(covers).T @ (np.array(w) / sum(w))
+        # scored on the best compatible equipment; nothing to score without
+        best = np.zeros(len(ports))
+        np.maximum.at(best, codes[compatible], row_score[compatible])
+        best[counts == 0] = np.nan
+    else:
+        best = np.full(len(ports), np.nan)
+
+    order = np.lexsort((np.arange(len(ports)), -best_checks, -np.nan_to_num(best), -counts))
+    if top_k is not None:
+        order = order[:top_k]
+    return pd.DataFrame(
+        {
+            "Port": [ports[i] for i in order],
+            "compatible_equipment": counts[order],
+            "capacity_score": np.round(best[order], 4),
+            "checks_met": best_checks[order],
+        }
+    )
@@ -0,0 +1,124 @@
+"""Background job that pre-computes weather compliance for all known ports.
+
+A daemon thread pulls the forecast for every port with coordinates once an
+hour (shortly after Open-Meteo publishes new data), checks it against the
+weather thresholds and keeps the latest :class:`FleetCompliance`.  Pages read
+that result instantly instead of waiting for the API.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Optional, Tuple
+
+import pandas as pd
+
+from bluebarge.compliance import HOUR, evaluate_fleet
+from bluebarge.ports import port_coordinates
+from bluebarge.weather import fetch_fleet
+
+logger = logging.getLogger(__name__)
+
+# seconds past the hour to wait for the new Open-Meteo run
+REFRESH_OFFSET = 300
+
+SUMMARY_COLUMNS = [
+    "Port",
+    "lat",
+    "lon",
+    "feasible_now",
+    "feasible_hours",
+    "next_window_start",
+    "longest_window_h",
+]
+
+InputsLoader = Callable[[], Tuple[pd.DataFrame, pd.DataFrame]]
+
+
+@dataclass(frozen=True)
+class FleetCompliance:
+    computed_at: datetime  # UTC
+    summary: pd.DataFrame  # one row per port
+    windows: pd.DataFrame  # Port, start, end, duration_h
+
+    def age_seconds(self) -> float:
+        return (datetime.now(timezone.utc) - self.computed_at).total_seconds()
+
+
+def compute_fleet_compliance(
+    equipment: pd.DataFrame, thresholds: pd.DataFrame
+) -> FleetCompliance:
+    """Fetch and evaluate the forecast for every port with coordinates."""
+    now = datetime.now(timezone.utc)
+    ports = port_coordinates(equipment)
+    if ports.empty:
+        return FleetCompliance(
+            now,
+            pd.DataFrame(columns=SUMMARY_COLUMNS),
+            pd.DataFrame(columns=["Port", "start", "end", "duration_h"]),
+        )
+
+    fleet = fetch_fleet(list(zip(ports["lat"], ports["lon"])))
+    epochs, feasible, windows = evaluate_fleet(thresholds, fleet.epochs, fleet.values, now=now)
+
+    windows = windows.assign(Port=ports["Port"].to_numpy()[windows["location"].to_numpy()])
+    windows = windows[["Port", "start", "end", "duration_h"]]
+    grouped = windows.groupby("Port")
+
+    summary = ports.copy()
+    summary["feasible_now"] = feasible[:, 0] if feasible.shape[1] else False
+    summary["feasible_hours"] = feasible.sum(axis=1)
+    summary["next_window_start"] = summary["Port"].map(grouped["start"].min())
+    summary["longest_window_h"] = (
+        summary["Port"].map(grouped["duration_h"].max()).fillna(0).astype(int)
+    )
+    return FleetCompliance(now, summary[SUMMARY_COLUMNS], windows.reset_index(drop=True))
+
+
+class ComplianceScheduler:
+    """Runs :func:`compute_fleet_compliance` once now and then every hour."""
+
+    def __init__(self, load_inputs: InputsLoader, offset: float = REFRESH_OFFSET):
+        self._load_inputs = load_inputs
+        self._offset = offset
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.latest: Optional[FleetCompliance] = None
+        self.last_error: Optional[str] = None
+        self.last_run: Optional[datetime] = None  # UTC, when the last refresh ended
+
+    def run_once(self) -> None:
+        try:
+            equipment, thresholds = self._load_inputs()
+            self.latest = compute_fleet_compliance(equipment, thresholds)
+            self.last_error = None
+        except Exception as e:
+            logger.exception("Fleet compliance refresh failed")
+            self.last_error = str(e)
+        finally:
+            self.last_run = datetime.now(timezone.utc)
+
+    def _seconds_to_next_run(self) -> float:
+        now = time.time()
+        return (now // HOUR + 1) * HOUR + self._offset - now
+
+    def _loop(self) -> None:
+        self.run_once()
+        while not self._stop.wait(self._seconds_to_next_run()):
+            self.run_once()
+
+    def start(self) -> "ComplianceScheduler":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._loop, name="fleet-compliance", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,204 @@
+"""Per-parameter scorers of the weighted compatibility score.
+
+Every Analysis-sheet ``Parameter ID`` maps to a :class:`Scorer`: how the
+barge value is scored against the required value (vectorized, as a 0..1
+share that the parameter's weight multiplies) and where the required value
+comes from.  Two optional Analysis-sheet columns configure a parameter
+without code changes:
+
+``Required Source``
+    one of :data:`REQUIRED_SOURCES`, or ``manual`` for a value entered by
+    hand.  When blank (or without the column) the parameter name picks the
+    default source (:data:`NAME_SOURCES`) and other names are entered by
+    hand, as the app always did.
+``Scorer``
+    one of :data:`SCORE_KINDS` (default ``ratio``, the
+    :func:`compute_score_contribution` rule).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from bluebarge.scoring import cover_share, weighted_contributions
+
+SOURCE_COLUMN = "Required Source"
+KIND_COLUMN = "Scorer"
+MANUAL = "manual"
+
+# source name -> required value from (uc_demand, ship demand row)
+REQUIRED_SOURCES: Dict[str, Callable[[Mapping, Mapping], float]] = {
+    "required_power_mw": lambda demand, ship: demand.get("required_power_mw", 1.0),
+    "required_energy_mwh": lambda demand, ship: demand.get("required_energy_mwh", 1.0),
+    "required_standard": lambda demand, ship: 1.0 if demand.get("required_standard") else 0.0,
+    "gt": lambda demand, ship: ship.get("gt", 0),
+}
+
+# lower-cased parameter name -> source, when the sheet declares none
+NAME_SOURCES = {
+    "power capacity match": "required_power_mw",
+    "port power capacity": "required_power_mw",
+    "energy autonomy": "required_energy_mwh",
+    "port energy capacity": "required_energy_mwh",
+    "standards compliance": "required_standard",
+    "vessel gross tonnage": "gt",
+}
+
+
+def _ratio(required: np.ndarray, provided: np.ndarray) -> np.ndarray:
+    return cover_share(provided, required)
+
+
+def _threshold(required: np.ndarray, provided: np.ndarray) -> np.ndarray:
+    # all or nothing: 1 once the requirement is met, 0 when nothing is required
+    return np.where(required == 0, 0.0, (provided >= required).astype(float))
+
+
+SCORE_KINDS: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "ratio": _ratio,
+    "threshold": _threshold,
+}
+
+
+@dataclass(frozen=True)
+class Scorer:
+    kind: str = "ratio"
+    source: Optional[str] = None  # None: the required value is entered by hand
+
+    def score(self, required, provided) -> np.ndarray:
+        """Share of the weight earned, for arrays of required/provided values."""
+        return SCORE_KINDS[self.kind](
+            np.asarray(required, dtype=float), np.asarray(provided, dtype=float)
+        )
+
+    def required(self, uc_demand: Mapping, ship: Mapping) -> Optional[float]:
+        """Required value from the declared source (None if entered by hand)."""
+        if self.source is None:
+            return None
+        return REQUIRED_SOURCES[self.source](uc_demand, ship)
+
+
+def _clean(value) -> Optional[str]:
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+@dataclass(frozen=True)
+class ScorerRegistry:
+    scorers: Dict[str, Scorer]
+    problems: Tuple[str, ...] = ()  # sheet entries that fell back to the defaults
+
+    def __getitem__(self, parameter_id) -> Scorer:
+        return self.scorers.get(str(parameter_id), Scorer())
+
+    def score(
+        self,
+        parameter_ids: Sequence,
+        required,
+        provided,
+        weight,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Contributions and totals, parameters on the last axis.
+
+        Like :func:`bluebarge.scoring.score_contributions`, but each
+        parameter is scored by its own scorer (:func:`score_kinds`).
+        """
+        return score_kinds([self[p].kind for p in parameter_ids], required, provided, weight)
+
+
+def score_kinds(kinds: Sequence[str], required, provided, weight) -> Tuple[np.ndarray, np.ndarray]:
+    """Contributions and totals, parameter ``i`` scored by ``SCORE_KINDS[kinds[i]]``.
+
+    Parameters are on the last axis; those sharing a kind are scored together.
+    """
+    required = np.asarray(required, dtype=float)
+    provided = np.asarray(provided, dtype=float)
+    weight = np.asarray(weight, dtype=float)
+    shape = np.broadcast_shapes(required.shape, provided.shape, weight.shape)
+    required, provided, weight = (np.broadcast_to(a, shape) for a in (required, provided, weight))
+
+    kinds = np.array(list(kinds), dtype=object)
+    share = np.zeros(shape)
+    for kind in np.unique(kinds):
+        columns = kinds == kind
+        share[..., columns] = SCORE_KINDS[kind](required[..., columns], provided[..., columns])
+    return weighted_contributions(share, weight)
+
+
+def build_registry(param_config: pd.DataFrame, strict: bool = False) -> ScorerRegistry:
+    """One scorer per Analysis-sheet parameter (see the module docstring).
+
+    An unknown source or kind (a typo in the sheet) falls back to the
+    default for that parameter, the name's source and ``ratio`` scoring,
+    and is listed in :attr:`ScorerRegistry.problems`; ``strict`` raises
+    ``ValueError`` instead.
+    """
+    has_source = SOURCE_COLUMN in param_config.columns
+    has_kind = KIND_COLUMN in param_config.columns
+    scorers = {}
+    problems = []
+    for _, row in param_config.iterrows():
+        name = str(row.get("Name", "")).strip().lower()
+        source = (_clean(row[SOURCE_COLUMN]) if has_source else None) or NAME_SOURCES.get(name)
+        if source is not None and source != MANUAL and source not in REQUIRED_SOURCES:
+            problems.append(f"unknown {SOURCE_COLUMN!r} {source!r} for {row['Parameter ID']}, default source used")
+            source = NAME_SOURCES.get(name)
+        if source == MANUAL:
+            source = None
+        kind = (_clean(row[KIND_COLUMN]) if has_kind else None) or "ratio"
+        if kind not in SCORE_KINDS:
+            problems.append(f"unknown {KIND_COLUMN!r} {kind!r} for {row['Parameter ID']}, scored as ratio")
+            kind = "ratio"
+        scorers[str(row["Parameter ID"])] = Scorer(kind=kind, source=source)
+    if strict and problems:
+        raise ValueError("; ".join(problems))
+    return ScorerRegistry(scorers, tuple(problems))
+
+
+def barge_values(barges: pd.DataFrame, names: Sequence[str]) -> np.ndarray:
+    """Barges x parameters values from a column per parameter name (missing: 0)."""
+    return (
+        barges.reindex(columns=list(names))
+        .apply(pd.to_numeric, errors="coerce")
+        .fillna(0.0)
+        .to_numpy(float)
+    )
+
+
+def rank_barges(
+    registry: ScorerRegistry,
+    parameters: pd.DataFrame,
+    barges: pd.DataFrame,
+    name_column: str = "Barge",
+) -> pd.DataFrame:
+    """Score many barge specs against one demand in a single evaluation.
+
+    ``parameters`` has one row per selected parameter (``Parameter ID``,
+    ``Parameter``, ``Required Value``, ``Weight``); ``barges`` one row per
+    barge with a column per parameter name holding the barge value (missing
+    values score as 0).  Returns the per-parameter contributions and the
+    total score per barge, best first.
+    """
+    names = list(parameters["Parameter"])
+    contributions, totals = registry.score(
+        list(parameters["Parameter ID"]),
+        parameters["Required Value"].to_numpy(float),
+        barge_values(barges, names),
+        parameters["Weight"].to_numpy(float),
+    )
+    result = pd.DataFrame(contributions, columns=names)
+    result.insert(0, "Total Score (%)", np.round(totals * 100, 1))
+    if name_column in barges.columns:
+        labels = barges[name_column].to_numpy(object)
+    else:
+        labels = np.arange(1, len(barges) + 1)
+    result.insert(0, name_column, labels)
+    result = result.sort_values("Total Score (%)", ascending=False, kind="stable", ignore_index=True)
+    result.insert(0, "Rank", np.arange(1, len(result) + 1))
+    return result
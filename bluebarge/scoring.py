@@ -0,0 +1,205 @@
+"""Scoring rules of the analysis page, as plain functions.
+
+Everything here works on plain values, dicts and DataFrames, so batch jobs,
+benchmarks and worker processes can score without a Streamlit session.  The
+app calls the same functions, which keeps both paths on one set of rules.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# ship type -> plug type of the shore connection
+SHIPTYPE_TO_PLUGTYPE = {
+    "Bulk carrier": "General Cargo",
+    "Container ship": "Container",
+    "Container": "Container",
+    "Ro-Pax": "Ro-Pax",
+    "Cruise": "Cruise",
+}
+
+# connection voltage -> IEC standard it implies
+VOLTAGE_STANDARDS = {
+    "HV": "IEC 80005-1",
+    "LV": "IEC 80005-3",
+}
+
+# above this demand HV is enforced when a ship supports both voltages
+HV_POWER_THRESHOLD_MW = 1.0
+
+# estimation method -> (power column, energy column) of the Ship Demand sheet
+METHOD_COLUMNS = {
+    "IMO": ("power_imo_mw", "energy_imo_mwh"),
+    "EMSA": ("power_emsa_mw", "energy_emsa_mwh"),
+    "LF": ("power_lf_mw", "energy_lf_mwh"),
+}
+METHODS = tuple(METHOD_COLUMNS) + ("Average",)
+
+
+def expected_plug_type(ship_type: str) -> str:
+    """Plug type a ship type connects with (the ship type itself if unmapped)."""
+    return SHIPTYPE_TO_PLUGTYPE.get(ship_type, ship_type)
+
+
+def demand_for_method(ship: Mapping[str, float], method: str) -> Tuple[float, float]:
+    """(power MW, energy MWh) of a Ship Demand row for an estimation method.
+
+    ``"Average"`` is the mean of the three methods, rounded to 2 decimals.
+    """
+    if method == "Average":
+        powers = [ship[p] for p, _ in METHOD_COLUMNS.values()]
+        energies = [ship[e] for _, e in METHOD_COLUMNS.values()]
+        return round(sum(powers) / len(powers), 2), round(sum(energies) / len(energies), 2)
+    power_column, energy_column = METHOD_COLUMNS[method]
+    return ship[power_column], ship[energy_column]
+
+
+@dataclass(frozen=True)
+class VoltageDecision:
+    """Connection voltage for a ship, or the options left to the user.
+
+    ``reason`` is one of ``"enforced"`` (both supported, power above the HV
+    threshold), ``"choice"`` (both supported, user picks from ``options``),
+    ``"hv_only"``, ``"lv_only"`` or ``"none"``.
+    """
+
+    voltage: Optional[str]
+    reason: str
+    options: Tuple[str, ...] = ()
+
+
+def decide_voltage(supports_hv: bool, supports_lv: bool, required_power: float) -> VoltageDecision:
+    if supports_hv and supports_lv:
+        if required_power > HV_POWER_THRESHOLD_MW:
+            return VoltageDecision("HV", "enforced")
+        return VoltageDecision(None, "choice", ("HV", "LV"))
+    if supports_hv:
+        return VoltageDecision("HV", "hv_only")
+    if supports_lv:
+        return VoltageDecision("LV", "lv_only")
+    return VoltageDecision(None, "none")
+
+
+def standard_for_voltage(voltage: Optional[str]) -> Optional[str]:
+    """IEC standard implied by a connection voltage (None if undecided)."""
+    return VOLTAGE_STANDARDS.get(voltage)
+
+
+def demand_profile(power: float, energy: float, voltage: Optional[str] = None) -> dict:
+    """The ``uc_demand`` dict the compatibility checks work on."""
+    return {
+        "required_power_mw": power,
+        "required_energy_mwh": energy,
+        "required_standard": standard_for_voltage(voltage),
+        "required_voltage": voltage,
+    }
+
+
+def compute_score_contribution(required, provided, weight):
+    if required == 0:
+        return 0.0
+    ratio = min(provided / required, 1.0)
+    return round(ratio * weight, 4)
+
+
+def cover_share(provided, required) -> np.ndarray:
+    """Vectorized ``min(provided / required, 1)``, 0 where nothing is required.
+
+    The one capacity-cover rule behind the weighted score, the match scores
+    and the port ranking; inputs broadcast against each other.
+    """
+    provided = np.asarray(provided, dtype=float)
+    required = np.asarray(required, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.minimum(provided / required, 1.0)
+    return np.where(required == 0, 0.0, ratio)
+
+
+def round_like_python(values, ndigits: int) -> np.ndarray:
+    """Vectorized built-in ``round(x, ndigits)``.
+
+    ``np.round`` scales, rounds and scales back, so values whose scaled
+    fraction sits at .5 can land on the other side of the tie than Python's
+    correctly rounded ``round``.  Those few are rounded with ``round``.
+    """
+    values = np.asarray(values, dtype=float)
+    rounded = np.array(np.round(values, ndigits), dtype=float)
+    scaled = values * 10.0**ndigits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    rounded[near_tie] = [round(float(v), ndigits) for v in values[near_tie]]
+    return rounded
+
+
+def weighted_contributions(share, weight) -> Tuple[np.ndarray, np.ndarray]:
+    """Rounded ``share * weight`` contributions and their totals over the last axis.
+
+    Contributions round like :func:`compute_score_contribution` on floats;
+    totals like the page's ``round(score_df[...].sum(), 4)``, which is a
+    numpy float and so rounds the numpy way.
+    """
+    contributions = round_like_python(np.asarray(share, dtype=float) * np.asarray(weight, dtype=float), 4)
+    return contributions, np.round(contributions.sum(axis=-1), 4)
+
+
+def score_contributions(required, provided, weight) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized :func:`compute_score_contribution`.
+
+    Inputs broadcast against each other with parameters on the last axis,
+    e.g. ``(scenarios, parameters)`` provided values against per-parameter
+    required values and weights.  Returns the rounded contributions and the
+    rounded per-scenario totals.
+    """
+    return weighted_contributions(cover_share(provided, required), weight)
+
+
+def scaled_score(barge_val, required_val):
+    """Percentage of the requirement covered, capped at 100."""
+    if required_val == 0:
+        return 0
+    return min((barge_val / required_val), 1.0) * 100
+
+
+def binary_score(barge_val: Sequence[str], required_val) -> int:
+    """100 if the barge offers the required value, else 0."""
+    return 100 if required_val in barge_val else 0
+
+
+def scaled_scores(barge_vals, required_vals) -> np.ndarray:
+    """Vectorized :func:`scaled_score` (broadcasting)."""
+    return cover_share(barge_vals, required_vals) * 100
+
+
+def _as_list(value) -> List[str]:
+    if isinstance(value, str):
+        return [x.strip() for x in value.split(",") if x.strip()]
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return []
+    return list(value)
+
+
+def binary_scores(barge_vals, required_vals, outer: bool = False) -> np.ndarray:
+    """Vectorized :func:`binary_score`.
+
+    ``barge_vals`` holds one offer per item, a list or a comma separated
+    string.  Scores pair them up with ``required_vals`` element-wise, or
+    every offer against every required value (offers x required) with
+    ``outer``.  Each distinct (offer, required value) pair is checked once.
+    """
+    keys = pd.Series(list(barge_vals), dtype=object).map(
+        lambda value: value if isinstance(value, str) else ",".join(_as_list(value))
+    )
+    offer_codes, offers = pd.factorize(keys)
+    codes, values = pd.factorize(pd.Series(list(required_vals), dtype=object))
+    table = np.zeros((len(offers) + 1, len(values) + 1), dtype=bool)  # last row/column: missing
+    for i, offer in enumerate(offers):
+        offered = set(_as_list(offer))
+        table[i, : len(values)] = [value in offered for value in values]
+    if outer:
+        hits = table[offer_codes][:, codes]
+    else:
+        hits = table[offer_codes, codes]
+    return np.where(hits, 100.0, 0.0)
@@ -0,0 +1,123 @@
+"""One-round-trip snapshot of the ``Bluebarge_Comp_Texts`` spreadsheet.
+
+The app used to open the spreadsheet and call ``get_all_records()`` once per
+worksheet.  :func:`fetch_values` reads every worksheet the app needs in a
+single ``values:batchGet`` request and :func:`build_snapshot` turns the rows
+into an immutable :class:`SheetSnapshot` that all pages read from.  The app
+and the batch job get theirs through :class:`bluebarge.store.SnapshotStore`,
+which only calls :func:`fetch_values` when the spreadsheet changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional
+
+import pandas as pd
+
+SPREADSHEET_TITLE = "Bluebarge_Comp_Texts"
+
+# snapshot field -> worksheet title (None means the first worksheet, ``sheet1``)
+WORKSHEETS: Dict[str, Optional[str]] = {
+    "use_cases": None,
+    "equipment": "Equipment List",
+    "param_config": "Analysis",
+    "ship_demand": "Ship Demand",
+    "weather_thresholds": "Weather Thresholds",
+    "voltage_compatibility": "Voltage Compatibility",
+}
+
+Rows = List[List[Any]]
+
+
+@dataclass(frozen=True)
+class SheetSnapshot:
+    """Every worksheet of the spreadsheet, read at the same instant.
+
+    The frames are shared between sessions, so callers must ``.copy()``
+    before mutating them.  ``revision`` is a digest of the raw cell values
+    and changes whenever any worksheet content changes; ``modified_time`` is
+    the Drive modification time of the spreadsheet when it is known.
+    """
+
+    use_cases: pd.DataFrame
+    equipment: pd.DataFrame
+    param_config: pd.DataFrame
+    ship_demand: pd.DataFrame
+    weather_thresholds: pd.DataFrame
+    voltage_compatibility: pd.DataFrame
+    revision: str
+    modified_time: Optional[str] = None
+
+
+def _numericise(value: Any) -> Any:
+    # Same conversion gspread's get_all_records() applies to each cell.
+    if not isinstance(value, str) or "_" in value:
+        return value
+    cleaned = value.replace(",", "")
+    try:
+        return int(cleaned)
+    except ValueError:
+        try:
+            return float(cleaned)
+        except ValueError:
+            return value
+
+
+def rows_to_frame(rows: Rows) -> pd.DataFrame:
+    """Turn raw worksheet rows (header first) into a records DataFrame."""
+    if not rows:
+        return pd.DataFrame()
+    header = list(rows[0])
+    width = max(len(row) for row in rows)
+    header += [""] * (width - len(header))
+    records = [
+        [_numericise(cell) for cell in list(row) + [""] * (width - len(row))]
+        for row in rows[1:]
+    ]
+    return pd.DataFrame(records, columns=header)
+
+
+def build_snapshot(
+    values: Mapping[str, Rows], modified_time: Optional[str] = None
+) -> SheetSnapshot:
+    """Build a :class:`SheetSnapshot` from raw rows keyed by snapshot field."""
+    frames = {field: rows_to_frame(values.get(field, [])) for field in WORKSHEETS}
+    thresholds = frames["weather_thresholds"]
+    if "Parameter" in thresholds.columns:
+        frames["weather_thresholds"] = thresholds.set_index("Parameter")
+
+    digest = hashlib.sha1(
+        json.dumps({field: values.get(field, []) for field in WORKSHEETS}, default=str).encode()
+    ).hexdigest()
+    return SheetSnapshot(revision=digest, modified_time=modified_time, **frames)
+
+
+def _a1_sheet_range(title: str) -> str:
+    return "'{}'".format(title.replace("'", "''"))
+
+
+def fetch_values(spreadsheet) -> Dict[str, Rows]:
+    """Read every worksheet in :data:`WORKSHEETS` with one batched request."""
+    titles = [ws.title for ws in spreadsheet.worksheets()]
+    if not titles:
+        raise LookupError(f"Spreadsheet {spreadsheet.title!r} has no worksheets")
+
+    wanted = {}
+    for field, title in WORKSHEETS.items():
+        title = titles[0] if title is None else title
+        if title not in titles:
+            raise LookupError(f"Worksheet {title!r} not found in {spreadsheet.title!r}")
+        wanted[field] = title
+
+    response = spreadsheet.values_batch_get(
+        [_a1_sheet_range(title) for title in wanted.values()],
+        params={"majorDimension": "ROWS"},
+    )
+    value_ranges = response.get("valueRanges", [])
+    return {
+        field: value_range.get("values", [])
+        for field, value_range in zip(wanted, value_ranges)
+    }
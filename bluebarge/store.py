@@ -0,0 +1,126 @@
+"""Persistent on-disk copy of the spreadsheet snapshot.
+
+The raw worksheet rows are kept in a small SQLite file together with the
+Drive ``modifiedTime`` they were read at.  :meth:`SnapshotStore.load_or_refresh`
+asks Drive for the current ``modifiedTime`` (one cheap metadata call) and only
+downloads the worksheets again when it differs, so restarts and redeploys are
+served from disk instead of re-reading every worksheet.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional, Tuple
+
+from bluebarge.sheets import SPREADSHEET_TITLE, Rows, SheetSnapshot, build_snapshot, fetch_values
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = ".bluebarge_snapshot.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS worksheets (field TEXT PRIMARY KEY, rows TEXT NOT NULL);
+"""
+
+
+class SnapshotStore:
+    """SQLite-backed snapshot of one spreadsheet, refreshed on change."""
+
+    def __init__(self, path: str = DEFAULT_PATH, title: str = SPREADSHEET_TITLE):
+        self.path = path
+        self.title = title
+        self._lock = threading.Lock()
+        self._snapshot: Optional[SheetSnapshot] = None
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:  # commit on success, roll back on error
+                yield conn
+        finally:
+            conn.close()
+
+    def read_meta(self) -> Dict[str, str]:
+        """Return the stored metadata (empty if nothing was stored yet)."""
+        with self._connect() as conn:
+            return dict(conn.execute("SELECT key, value FROM meta"))
+
+    def read_values(self) -> Dict[str, Rows]:
+        """Return the stored worksheet rows keyed by snapshot field."""
+        with self._connect() as conn:
+            return {
+                field: json.loads(rows)
+                for field, rows in conn.execute("SELECT field, rows FROM worksheets")
+            }
+
+    def write(self, spreadsheet_id: str, modified_time: str, values: Dict[str, Rows]) -> None:
+        """Replace the stored snapshot atomically."""
+        meta = {
+            "spreadsheet_id": spreadsheet_id,
+            "modified_time": modified_time,
+            "fetched_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        with self._connect() as conn:
+            conn.execute("DELETE FROM worksheets")
+            conn.executemany(
+                "INSERT INTO worksheets (field, rows) VALUES (?, ?)",
+                [(field, json.dumps(rows)) for field, rows in values.items()],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", meta.items()
+            )
+
+    def _remote_revision(self, client) -> Tuple[str, str]:
+        files = client.list_spreadsheet_files(self.title)
+        for item in files:
+            if item.get("name") == self.title:
+                return item["id"], item["modifiedTime"]
+        raise LookupError(f"Spreadsheet {self.title!r} not found")
+
+    def _stored_snapshot(self, modified_time: str) -> SheetSnapshot:
+        cached = self._snapshot
+        if cached is None or cached.modified_time != modified_time:
+            cached = build_snapshot(self.read_values(), modified_time=modified_time)
+            self._snapshot = cached
+        return cached
+
+    def load_stored(self) -> SheetSnapshot:
+        """Serve the stored snapshot without contacting Drive."""
+        with self._lock:
+            stored_time = self.read_meta().get("modified_time")
+            if stored_time is None:
+                raise LookupError(f"No stored snapshot in {self.path!r}")
+            return self._stored_snapshot(stored_time)
+
+    def load_or_refresh(self, client) -> SheetSnapshot:
+        """Serve the stored snapshot, downloading again only if Drive changed.
+
+        If Drive cannot be reached but a stored copy exists, the stored copy
+        is served so the app keeps working offline.
+        """
+        with self._lock:
+            stored_time = self.read_meta().get("modified_time")
+            try:
+                spreadsheet_id, modified_time = self._remote_revision(client)
+            except Exception:
+                if stored_time is None:
+                    raise
+                logger.warning("Revision check failed, serving stored snapshot", exc_info=True)
+                return self._stored_snapshot(stored_time)
+
+            if stored_time == modified_time:
+                return self._stored_snapshot(stored_time)
+
+            values = fetch_values(client.open_by_key(spreadsheet_id))
+            self.write(spreadsheet_id, modified_time, values)
+            self._snapshot = build_snapshot(values, modified_time=modified_time)
+            return self._snapshot
@@ -0,0 +1,220 @@
+"""Monte-Carlo sweep of the weighted compatibility score.
+
+The weights of the Analysis sheet are perturbed with a Dirichlet draw around
+their defaults (total weight kept), required values are sampled from
+ranges, and every alternative barge has its provided values sampled from its
+own ranges.  Each scenario is scored like the page scores it, every
+parameter by its own scorer kind (:func:`bluebarge.scorers.score_kinds`), in
+chunks spread over worker processes; every chunk has its own child of one
+:class:`numpy.random.SeedSequence`, so results depend on the seed and not on
+the number of workers.
+
+:func:`tornado` is the deterministic one-at-a-time companion: each input is
+moved to the ends of its range while the others stay at their midpoint.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from bluebarge.scorers import score_kinds
+
+CHUNK = 100_000
+
+# at most this many scenario x alternative x parameter values per chunk
+CHUNK_VALUES = 2_000_000
+
+# Dirichlet concentration: larger keeps the weights closer to the defaults
+CONCENTRATION = 50.0
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+@dataclass(frozen=True)
+class SweepSpec:
+    weights: np.ndarray  # P
+    required_low: np.ndarray  # P
+    required_high: np.ndarray  # P
+    provided_low: np.ndarray  # A x P, one row per alternative
+    provided_high: np.ndarray  # A x P
+    concentration: Optional[float] = CONCENTRATION  # None keeps weights fixed
+    kinds: Tuple[str, ...] = ()  # scorer kind per parameter, all ratio when empty
+
+    @classmethod
+    def build(
+        cls,
+        weights,
+        required_low,
+        required_high,
+        provided_low,
+        provided_high,
+        concentration: Optional[float] = CONCENTRATION,
+        kinds: Sequence[str] = (),
+    ) -> "SweepSpec":
+        return cls(
+            np.asarray(weights, dtype=float),
+            np.asarray(required_low, dtype=float),
+            np.asarray(required_high, dtype=float),
+            np.atleast_2d(np.asarray(provided_low, dtype=float)),
+            np.atleast_2d(np.asarray(provided_high, dtype=float)),
+            concentration,
+            tuple(kinds),
+        )
+
+    def score(self, required, provided, weights) -> np.ndarray:
+        """Total scores, parameters on the last axis."""
+        kinds = self.kinds or ("ratio",) * len(self.weights)
+        return score_kinds(kinds, required, provided, weights)[1]
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    totals: np.ndarray  # scenarios x alternatives
+    first_place: np.ndarray  # A, share of scenarios each alternative ranks first
+    mean_rank: np.ndarray  # A, 1 = best
+
+    def distribution(self, percentiles: Sequence[float] = PERCENTILES) -> pd.DataFrame:
+        """Mean, spread and percentiles of the total score per alternative."""
+        frame = pd.DataFrame(
+            np.percentile(self.totals, percentiles, axis=0).T,
+            columns=[f"p{p:g}" for p in percentiles],
+        )
+        frame.insert(0, "std", self.totals.std(axis=0))
+        frame.insert(0, "mean", self.totals.mean(axis=0))
+        return frame
+
+    def rank_stability(self) -> pd.DataFrame:
+        return pd.DataFrame({"first_place": self.first_place, "mean_rank": self.mean_rank})
+
+
+def _sample_weights(rng: np.random.Generator, spec: SweepSpec, n: int) -> np.ndarray:
+    if spec.concentration is None:
+        return np.broadcast_to(spec.weights, (n, len(spec.weights)))
+    total = spec.weights.sum()
+    alpha = spec.concentration * spec.weights / total
+    weights = np.zeros((n, len(spec.weights)))
+    positive = alpha > 0
+    weights[:, positive] = rng.dirichlet(alpha[positive], size=n) * total
+    return weights
+
+
+def _run_chunk(spec: SweepSpec, n: int, seed: np.random.SeedSequence) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    n_alt, n_par = spec.provided_low.shape
+    weights = _sample_weights(rng, spec, n)
+    required = rng.uniform(spec.required_low, spec.required_high, size=(n, n_par))
+    provided = rng.uniform(spec.provided_low, spec.provided_high, size=(n, n_alt, n_par))
+    return spec.score(required[:, None, :], provided, weights[:, None, :])
+
+
+def _rank_summary(totals: np.ndarray, chunk: int = CHUNK):
+    """(share ranked first, mean rank) per alternative; rank 1 = highest total.
+
+    Ties share the better rank.  Each block of scenarios is sorted per row
+    (``argsort``), so memory stays at a few block x alternatives arrays.
+    """
+    n, n_alt = totals.shape
+    first = np.zeros(n_alt)
+    rank_sum = np.zeros(n_alt)
+    for start in range(0, n, chunk):
+        block = totals[start : start + chunk]
+        rows = np.arange(len(block))[:, None]
+        order = np.argsort(-block, axis=1, kind="stable")
+        ordered = block[rows, order]
+        # a tie takes the position of the first of its group
+        new_value = np.ones(ordered.shape, dtype=bool)
+        new_value[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+        position = np.arange(1, n_alt + 1, dtype=np.int32)
+        ranked = np.maximum.accumulate(np.where(new_value, position, 0), axis=1)
+        ranks = np.empty_like(ranked)
+        ranks[rows, order] = ranked
+        first += (ranks == 1).sum(axis=0)
+        rank_sum += ranks.sum(axis=0)
+    if not n:
+        return first, rank_sum
+    return first / n, rank_sum / n
+
+
+def run_sweep(
+    spec: SweepSpec,
+    n_scenarios: int,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    chunk: int = CHUNK,
+) -> SweepResult:
+    """Score ``n_scenarios`` sampled scenarios for every alternative.
+
+    ``workers`` defaults to all cores; ``workers=1`` runs in this process
+    (what the app does: no pool is started inside the Streamlit server).
+    """
+    chunk = max(1, min(chunk, CHUNK_VALUES // max(spec.provided_low.size, 1)))
+    starts = range(0, n_scenarios, chunk)
+    sizes = [min(chunk, n_scenarios - start) for start in starts]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = workers or os.cpu_count() or 1
+    # chunks are written in place, no second scenarios x alternatives copy
+    totals = np.empty((n_scenarios, spec.provided_low.shape[0]))
+    if workers == 1 or len(sizes) == 1:
+        for start, n, s in zip(starts, sizes, seeds):
+            totals[start : start + n] = _run_chunk(spec, n, s)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(sizes))) as pool:
+            parts = pool.map(_run_chunk, [spec] * len(sizes), sizes, seeds)
+            for start, n, part in zip(starts, sizes, parts):
+                totals[start : start + n] = part
+    first_place, mean_rank = _rank_summary(totals, chunk)
+    return SweepResult(totals=totals, first_place=first_place, mean_rank=mean_rank)
+
+
+def tornado(
+    spec: SweepSpec,
+    names: Sequence[str],
+    alternative: int = 0,
+    weight_swing: float = 0.2,
+) -> pd.DataFrame:
+    """One-at-a-time swings of the total score, largest first.
+
+    Required and provided values move to the ends of their ranges and each
+    weight by ``weight_swing`` (relative); everything else stays at the
+    midpoint / default.
+    """
+    required = (spec.required_low + spec.required_high) / 2
+    provided = (spec.provided_low[alternative] + spec.provided_high[alternative]) / 2
+    weights = spec.weights
+    n_par = len(weights)
+    totals = spec.score
+
+    # 2 * P scenarios per factor: row 2p is the low end, 2p + 1 the high end
+    eye = np.repeat(np.eye(n_par, dtype=bool), 2, axis=0)
+    low_high = np.tile([True, False], n_par)[:, None]
+
+    req = np.where(eye, np.where(low_high, spec.required_low, spec.required_high), required)
+    prov_low, prov_high = spec.provided_low[alternative], spec.provided_high[alternative]
+    prov = np.where(eye, np.where(low_high, prov_low, prov_high), provided)
+    w = np.where(eye, np.where(low_high, weights * (1 - weight_swing), weights * (1 + weight_swing)), weights)
+
+    base = float(totals(required, provided, weights))
+    rows = []
+    for factor, values in (
+        ("required", totals(req, np.broadcast_to(provided, req.shape), weights)),
+        ("provided", totals(np.broadcast_to(required, prov.shape), prov, weights)),
+        ("weight", totals(required, provided, w)),
+    ):
+        low, high = values[0::2], values[1::2]
+        for p, name in enumerate(names):
+            rows.append(
+                {
+                    "parameter": name,
+                    "factor": factor,
+                    "low": round(low[p] - base, 4),
+                    "high": round(high[p] - base, 4),
+                    "swing": round(abs(high[p] - low[p]), 4),
+                }
+            )
+    return pd.DataFrame(rows).sort_values("swing", ascending=False, ignore_index=True)
@@ -0,0 +1,78 @@
+"""Vectorized helpers for Open-Meteo ``hourly`` series.
+
+The ``hourly.time`` array is parsed into int64 UTC epoch seconds in one NumPy
+call and the "latest observation not after now" position is found with a
+binary search, for any number of variables at once.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+Instant = Union[datetime, int, float, None]
+
+
+class Observation(NamedTuple):
+    time: datetime  # UTC, timezone-aware
+    value: float
+
+
+def to_epoch(instant: Instant = None) -> int:
+    """UTC epoch seconds for a datetime (naive means UTC), a number or now."""
+    if instant is None:
+        return int(datetime.now(timezone.utc).timestamp())
+    if isinstance(instant, datetime):
+        if instant.tzinfo is None:
+            instant = instant.replace(tzinfo=timezone.utc)
+        return int(instant.timestamp())
+    return int(instant)
+
+
+def parse_times(times: Iterable[str]) -> np.ndarray:
+    """Parse ISO-8601 GMT timestamps (Open-Meteo default) into epoch seconds."""
+    return np.asarray(list(times), dtype="datetime64[s]").astype(np.int64)
+
+
+def parse_hourly(
+    hourly: Mapping[str, Any], variables: Optional[Iterable[str]] = None
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Return ``(epochs, {variable: float array})`` for an ``hourly`` block.
+
+    Missing values (``null`` in the JSON) become ``NaN``.  ``variables``
+    defaults to every series in the block.
+    """
+    if variables is None:
+        variables = [key for key in hourly if key != "time"]
+    epochs = parse_times(hourly["time"])
+    values = {var: np.asarray(hourly[var], dtype=float) for var in variables}
+    return epochs, values
+
+
+def latest_index(epochs: np.ndarray, now: Instant = None) -> int:
+    """Index of the last timestamp ``<= now`` or ``-1`` if there is none."""
+    return int(np.searchsorted(epochs, to_epoch(now), side="right")) - 1
+
+
+def latest_observations(
+    hourly: Mapping[str, Any],
+    variables: Optional[Iterable[str]] = None,
+    now: Instant = None,
+) -> Dict[str, Optional[Observation]]:
+    """Latest value at or before ``now`` for each variable.
+
+    A variable maps to ``None`` when the series has no timestamp before
+    ``now`` or the value at that hour is missing.
+    """
+    epochs, values = parse_hourly(hourly, variables)
+    idx = latest_index(epochs, now)
+    result: Dict[str, Optional[Observation]] = {}
+    for var, series in values.items():
+        if idx < 0 or np.isnan(series[idx]):
+            result[var] = None
+        else:
+            when = datetime.fromtimestamp(int(epochs[idx]), tz=timezone.utc)
+            result[var] = Observation(when, float(series[idx]))
+    return result
@@ -0,0 +1,63 @@
+"""Timezone lookups without reloading the polygon data on every rerun.
+
+The :class:`timezonefinder.TimezoneFinder` is created lazily, once per
+process.  Known ports get their IANA timezone resolved once per equipment
+snapshot (:func:`build_port_timezones`); clicks inside a known port's grid
+cell are then answered with a dict lookup and only other points fall back
+to the polygon search.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from bluebarge.weather_cache import GRID_DEG, snap
+
+DEFAULT_TIMEZONE = "UTC"
+
+_lock = threading.Lock()
+_finder = None
+
+
+def get_finder():
+    """The process-wide TimezoneFinder, created on first use."""
+    global _finder
+    with _lock:
+        if _finder is None:
+            from timezonefinder import TimezoneFinder
+
+            _finder = TimezoneFinder()
+        return _finder
+
+
+def polygon_timezone(lat: float, lon: float) -> str:
+    """Timezone from the polygon search (``UTC`` when nothing matches)."""
+    return get_finder().timezone_at(lng=lon, lat=lat) or DEFAULT_TIMEZONE
+
+
+@dataclass(frozen=True)
+class PortTimezones:
+    by_port: Dict[str, str] = field(default_factory=dict)
+    by_cell: Dict[Tuple[float, float], str] = field(default_factory=dict)
+
+    def resolve(self, lat: float, lon: float) -> str:
+        """Dict lookup for known port cells, polygon search otherwise."""
+        tz = self.by_cell.get(snap(lat, lon, GRID_DEG))
+        return tz if tz is not None else polygon_timezone(lat, lon)
+
+    def for_port(self, port: str) -> Optional[str]:
+        return self.by_port.get(port)
+
+
+def build_port_timezones(ports: pd.DataFrame) -> PortTimezones:
+    """Resolve every ``Port, lat, lon`` row (see ``ports.port_coordinates``)."""
+    by_port, by_cell = {}, {}
+    for port, lat, lon in ports[["Port", "lat", "lon"]].itertuples(index=False):
+        tz = polygon_timezone(lat, lon)
+        by_port[port] = tz
+        by_cell.setdefault(snap(lat, lon, GRID_DEG), tz)
+    return PortTimezones(by_port, by_cell)
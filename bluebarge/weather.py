@@ -0,0 +1,196 @@
+"""Open-Meteo client: marine and forecast data fetched concurrently.
+
+Both endpoints are queried at the same time over a shared, pooled
+keep-alive session, so the caller waits for the slower of the two calls
+instead of their sum.  Every attempt has a connect/read timeout, transient
+failures are retried a bounded number of times with exponential backoff,
+and the whole fetch is capped by an overall deadline.  Responses are kept
+in a process-wide grid-cell cache (:mod:`bluebarge.weather_cache`).
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from bluebarge.timeseries import parse_hourly
+from bluebarge.weather_cache import WeatherCache, snap
+
+MARINE_URL = "https://marine-api.open-meteo.com/v1/marine"
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+# (connect, read) seconds for a single attempt
+REQUEST_TIMEOUT = (3.05, 10.0)
+# upper bound for one fetch including retries and backoff
+FETCH_DEADLINE = 30.0
+# coordinates per multi-location request, keeps the URL a sane length
+MAX_LOCATIONS = 200
+
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+)
+
+_lock = threading.Lock()
+_session = None
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="open-meteo")
+
+# shared by every session in the process
+cache = WeatherCache()
+
+
+class WeatherFetchError(Exception):
+    """Raised when Open-Meteo data could not be fetched in time."""
+
+
+def _get_session() -> requests.Session:
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def get_json(url: str, params: Dict[str, Any]) -> Any:
+    """GET ``url`` with retries and per-attempt timeouts, return the JSON body."""
+    response = _get_session().get(url, params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_concurrently(
+    requests_: Sequence[Tuple[str, Dict[str, Any]]], deadline: float = FETCH_DEADLINE
+) -> list:
+    """Run several ``(url, params)`` GETs at once and return their JSON bodies."""
+    futures = [_executor.submit(get_json, url, params) for url, params in requests_]
+    done, pending = wait(futures, timeout=deadline)
+    if pending:
+        for future in pending:
+            future.cancel()
+        raise WeatherFetchError(f"Open-Meteo did not answer within {deadline:.0f} s")
+    try:
+        return [future.result() for future in futures]
+    except (requests.RequestException, ValueError) as e:
+        raise WeatherFetchError(str(e)) from e
+
+
+def fetch_marine_and_forecast(
+    lat: float,
+    lon: float,
+    marine_vars: Sequence[str] = ("wave_height",),
+    forecast_vars: Sequence[str] = ("wind_speed_10m",),
+    deadline: float = FETCH_DEADLINE,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Fetch hourly marine and forecast data for one point concurrently.
+
+    Responses come from :data:`cache` when another session already asked
+    for the same grid cell and variables this hour; only the missing
+    endpoints are requested.  The point is snapped to its grid cell centre
+    so the cached answer is valid for every click inside the cell.
+    """
+    lat, lon = snap(lat, lon, cache.grid)
+    wanted = {
+        MARINE_URL: marine_vars,
+        FORECAST_URL: forecast_vars,
+    }
+    keys = {url: cache.key(url, lat, lon, variables) for url, variables in wanted.items()}
+    results = {url: cache.get(key) for url, key in keys.items()}
+
+    missing = [url for url, result in results.items() if result is None]
+    if missing:
+        fetched = fetch_concurrently(
+            [
+                (url, {"latitude": lat, "longitude": lon, "hourly": ",".join(wanted[url])})
+                for url in missing
+            ],
+            deadline=deadline,
+        )
+        for url, result in zip(missing, fetched):
+            cache.put(keys[url], result)
+            results[url] = result
+    return results[MARINE_URL], results[FORECAST_URL]
+
+
+@dataclass(frozen=True)
+class FleetWeather:
+    """Hourly series for many locations on one shared time axis."""
+
+    lat: np.ndarray
+    lon: np.ndarray
+    epochs: np.ndarray  # hourly UTC epoch seconds
+    values: Dict[str, np.ndarray]  # variable -> locations x hours
+
+
+def _coordinate_params(coords: Sequence[Tuple[float, float]], variables: Sequence[str]) -> Dict[str, Any]:
+    return {
+        "latitude": ",".join(f"{lat:.4f}" for lat, _ in coords),
+        "longitude": ",".join(f"{lon:.4f}" for _, lon in coords),
+        "hourly": ",".join(variables),
+    }
+
+
+def _locations(payload: Any) -> List[Dict[str, Any]]:
+    # Open-Meteo answers a list for several coordinates, an object for one
+    return payload if isinstance(payload, list) else [payload]
+
+
+def fetch_fleet(
+    coords: Sequence[Tuple[float, float]],
+    marine_vars: Sequence[str] = ("wave_height",),
+    forecast_vars: Sequence[str] = ("wind_speed_10m",),
+    deadline: float = FETCH_DEADLINE,
+) -> FleetWeather:
+    """Fetch marine and forecast data for many points in a few requests.
+
+    Coordinates are sent as comma separated lists, up to
+    :data:`MAX_LOCATIONS` per request, and all requests run concurrently.
+    Every series is placed on the hours shared by all responses and
+    stacked into a ``locations x hours`` array.
+    """
+    coords = list(coords)
+    chunks = [coords[i : i + MAX_LOCATIONS] for i in range(0, len(coords), MAX_LOCATIONS)]
+    jobs = []
+    for chunk in chunks:
+        jobs.append((MARINE_URL, _coordinate_params(chunk, marine_vars)))
+        jobs.append((FORECAST_URL, _coordinate_params(chunk, forecast_vars)))
+    payloads = fetch_concurrently(jobs, deadline=deadline) if jobs else []
+
+    marine = [loc for payload in payloads[0::2] for loc in _locations(payload)]
+    forecast = [loc for payload in payloads[1::2] for loc in _locations(payload)]
+    parsed = [
+        [parse_hourly(loc["hourly"], variables) for loc in locations]
+        for locations, variables in ((marine, marine_vars), (forecast, forecast_vars))
+    ]
+
+    epochs = None
+    for block in parsed:
+        for loc_epochs, _ in block:
+            epochs = loc_epochs if epochs is None else np.intersect1d(epochs, loc_epochs)
+    if epochs is None:
+        epochs = np.empty(0, dtype=np.int64)
+
+    values: Dict[str, np.ndarray] = {}
+    for block, variables in zip(parsed, (marine_vars, forecast_vars)):
+        for var in variables:
+            rows = [vals[var][np.searchsorted(loc_epochs, epochs)] for loc_epochs, vals in block]
+            values[var] = np.vstack(rows) if rows else np.empty((0, len(epochs)))
+
+    return FleetWeather(
+        lat=np.array([lat for lat, _ in coords], dtype=float),
+        lon=np.array([lon for _, lon in coords], dtype=float),
+        epochs=epochs,
+        values=values,
+    )
@@ -0,0 +1,92 @@
+"""Process-wide LRU cache for Open-Meteo responses, keyed by grid cell.
+
+Keys are ``(endpoint, lat cell, lon cell, variables, model run hour)``.
+Coordinates are snapped to a regular grid so operators clicking anywhere in
+the same anchorage share one entry.  Open-Meteo publishes new data every
+hour, so entries expire at the top of the next UTC hour.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, Optional, Tuple
+
+GRID_DEG = 0.1
+MAX_ENTRIES = 512
+
+
+def snap(lat: float, lon: float, grid: float = GRID_DEG) -> Tuple[float, float]:
+    """Centre of the grid cell containing ``(lat, lon)``."""
+    return (
+        round(math.floor(lat / grid) * grid + grid / 2, 6),
+        round(math.floor(lon / grid) * grid + grid / 2, 6),
+    )
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class WeatherCache:
+    """Thread-safe LRU cache whose entries expire on the hour."""
+
+    def __init__(
+        self,
+        max_entries: int = MAX_ENTRIES,
+        grid: float = GRID_DEG,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_entries = max_entries
+        self.grid = grid
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._hits = self._misses = self._evictions = 0
+
+    def key(self, endpoint: str, lat: float, lon: float, variables: Iterable[str]) -> Hashable:
+        run_hour = int(self._clock() // 3600)
+        return (endpoint, *snap(lat, lon, self.grid), tuple(sorted(variables)), run_hour)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        expires_at = (self._clock() // 3600 + 1) * 3600
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
@@ -1,59 +1,172 @@
 ############read from google sheets###########################################
 import streamlit as st
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
-from google.oauth2.service_account import Credentials
 import pandas as pd
-import json
-import tempfile
-import matplotlib.pyplot as plt
-import numpy as np
-import requests
-import folium
-from streamlit_folium import st_folium
-from datetime import datetime, timedelta
-from timezonefinder import TimezoneFinder
-import pytz
-
-
-def compute_score_contribution(required, provided, weight):
-    if required == 0:
-        return 0.0
-    ratio = min(provided / required, 1.0)
-    return round(ratio * weight, 4)
-
-
-@st.cache_data(ttl=600)
+import os
+
+# Only what every page needs is imported here; page specific (and heavy)
+# dependencies are imported inside the page that uses them.
+# `python -m bluebarge.coldstart` checks the import budget of each page.
+from bluebarge.fixture import FixtureClient
+from bluebarge.sheets import SheetSnapshot
+from bluebarge.store import DEFAULT_PATH, SnapshotStore
+
+
+@st.cache_resource
+def snapshot_store():
+    return SnapshotStore(os.environ.get("BLUEBARGE_SNAPSHOT_DB", DEFAULT_PATH))
+
+
+@st.cache_resource(ttl=60)  # revision check every minute, shared by all sessions
+def load_snapshot():
+    # Served from disk; worksheets are downloaded again only if the sheet changed
+    return snapshot_store().load_or_refresh(client)
+
+
+@st.cache_resource
+def compliance_scheduler():
+    from bluebarge.scheduler import ComplianceScheduler
+
+    # One background thread per server process, refreshed every hour
+    store, sheets_client = snapshot_store(), client
+
+    def load_inputs():
+        snapshot = store.load_or_refresh(sheets_client)
+        return snapshot.equipment, snapshot.weather_thresholds
+
+    return ComplianceScheduler(load_inputs).start()
+
+
+# Per-snapshot resources take the snapshot they are built from and are keyed
+# on its revision; the last two revisions are kept, older ones are released
+SNAPSHOT_KEY = {SheetSnapshot: lambda snapshot: snapshot.revision}
+
+
+@st.cache_resource(max_entries=2, hash_funcs=SNAPSHOT_KEY)
+def load_port_timezones(snapshot):
+    # Built once per snapshot revision; the finder itself is loaded once per process.
+    # Only ports with Latitude/Longitude columns get a table entry; without them
+    # every lookup falls back to the (cached) polygon search
+    from bluebarge.ports import port_coordinates
+    from bluebarge.timezones import build_port_timezones
+
+    return build_port_timezones(port_coordinates(snapshot.equipment))
+
+
+@st.cache_resource(max_entries=2, hash_funcs=SNAPSHOT_KEY)
+def load_compatibility_matrix(snapshot):
+    from bluebarge.compatibility import compatibility_matrix
+
+    ship_types = snapshot.ship_demand["ship_type"].dropna().unique().tolist()
+    return compatibility_matrix(snapshot.equipment, ship_types)
+
+
+@st.cache_resource(max_entries=2, hash_funcs=SNAPSHOT_KEY)
+def load_equipment_index(snapshot):
+    from bluebarge.equipment_index import EquipmentIndex
+
+    return EquipmentIndex.from_frame(snapshot.equipment)
+
+
+@st.cache_resource(max_entries=2, hash_funcs=SNAPSHOT_KEY)
+def load_demand_table(snapshot):
+    # every ship type x method with power, energy, voltage and standard resolved
+    from bluebarge.demand import build_demand_table
+
+    return build_demand_table(snapshot.ship_demand, snapshot.voltage_compatibility)
+
+
+@st.cache_resource(max_entries=2, hash_funcs=SNAPSHOT_KEY)
+def load_scorer_registry(snapshot):
+    from bluebarge.scorers import build_registry
+
+    return build_registry(snapshot.param_config)
+
+
+@st.cache_data(max_entries=16, hash_funcs=SNAPSHOT_KEY)
+def explore_designs(snapshot, method, n_designs, power_range, energy_range, costs, per_ship_type):
+    # Random candidate designs and their Pareto frontier; the expander body
+    # runs on every rerun, so only new inputs pay for the scoring
+    import numpy as np
+    from bluebarge.pareto import pareto_designs
+
+    cost_mw, cost_mwh, cost_dual = costs
+    rng = np.random.default_rng(0)
+    voltage_options = np.array(["LV", "HV", "HV, LV"])
+    standard_by_voltage = {
+        "LV": "IEC 80005-3",
+        "HV": "IEC 80005-1",
+        "HV, LV": "IEC 80005-1, IEC 80005-3",
+    }
+    designs = pd.DataFrame(
+        {
+            "power_mw": rng.uniform(*power_range, n_designs).round(1),
+            "energy_mwh": rng.uniform(*energy_range, n_designs).round(0),
+            "voltage_levels": rng.choice(voltage_options, n_designs),
+        }
+    )
+    designs["standards"] = designs["voltage_levels"].map(standard_by_voltage)
+    designs["cost"] = (
+        cost_mw * designs["power_mw"]
+        + cost_mwh * designs["energy_mwh"]
+        + cost_dual * (designs["voltage_levels"] == "HV, LV")
+    ).round(2)
+
+    # mean score weighted by each ship type's annual port calls
+    method_demand = load_demand_table(snapshot).for_method(method)
+    call_weights = (
+        pd.to_numeric(method_demand["port_calls (no.)"], errors="coerce")
+        .fillna(0)
+        .to_numpy(float)
+    )
+    return pareto_designs(
+        designs,
+        method_demand,
+        weights=call_weights if call_weights.sum() > 0 else None,
+        per_ship_type=per_ship_type,
+    )
+
+
+@st.cache_data(max_entries=16)
+def sweep_summary(weights, required_range, provided_range, n_scenarios, barge_names, kinds):
+    # Scenarios are sampled in this process: no worker pool is started
+    # inside the server on a rerun, and unchanged inputs are not resampled
+    import numpy as np
+    from bluebarge.sweep import SweepSpec, run_sweep
+
+    spec = SweepSpec.build(weights, *required_range, *provided_range, kinds=kinds)
+    result = run_sweep(spec, n_scenarios, seed=0, workers=1)
+    distribution = result.distribution()
+    distribution.insert(0, "Barge", barge_names)
+    stability = result.rank_stability()
+    stability = pd.DataFrame(
+        {
+            "Barge": barge_names,
+            "First Place (%)": (stability["first_place"] * 100).round(1),
+            "Mean Rank": stability["mean_rank"].round(2),
+        }
+    )
+    histograms = [np.histogram(totals, bins=40) for totals in result.totals.T]
+    return distribution, stability, histograms
+
+
 def load_equipment_data():
-    spreadsheet = client.open("Bluebarge_Comp_Texts")
-    equipment_sheet = spreadsheet.worksheet("Equipment List")
-    equipment_data = pd.DataFrame(equipment_sheet.get_all_records())
-    return equipment_data
+    return load_snapshot().equipment
 
 
-@st.cache_data(ttl=600)  # 10 dakika cache
 def load_param_config():
-    spreadsheet = client.open("Bluebarge_Comp_Texts")
-    param_config_sheet = spreadsheet.worksheet("Analysis")
-    param_config_df = pd.DataFrame(param_config_sheet.get_all_records())
-    return param_config_df
+    return load_snapshot().param_config
 
 
-@st.cache_data(ttl=600)
 def load_ship_demand():
-    spreadsheet = client.open("Bluebarge_Comp_Texts")
-    ship_sheet = spreadsheet.worksheet("Ship Demand")
-    ship_demand_df = pd.DataFrame(ship_sheet.get_all_records())
-    return ship_demand_df
+    return load_snapshot().ship_demand
 
 
-@st.cache_data(ttl=600)
 def load_weather_thresholds():
-    spreadsheet = client.open("Bluebarge_Comp_Texts")
-    weather_sheet = spreadsheet.worksheet("Weather Thresholds")
-    df = pd.DataFrame(weather_sheet.get_all_records())
-    df.set_index("Parameter", inplace=True)
-    return df
+    return load_snapshot().weather_thresholds
+
+
+def load_voltage_compatibility():
+    return load_snapshot().voltage_compatibility
 
 
 columns_to_keep = {
@@ -74,28 +187,21 @@ with open("bluebarge-logo-white.svg", "r") as f:
 
 st.sidebar.markdown(svg_logo, unsafe_allow_html=True)
 
-from google.oauth2.service_account import Credentials
-import gspread
-
-# Step 1: Load the service account JSON from secrets
-gcp_secrets = st.secrets["gcp_service_account"]
-
-# Step 2: Save to a temporary JSON file
-with tempfile.NamedTemporaryFile(mode="w",delete=False, suffix=".json") as tmp:
-    gcp_secrets = {k: v for k, v in st.secrets["gcp_service_account"].items()}
-    json.dump(dict(st.secrets["gcp_service_account"]), tmp)
-    tmp_path = tmp.name
+if os.environ.get("BLUEBARGE_SHEETS_FIXTURE"):
+    # Offline: a local JSON workbook stands in for Google Sheets
+    client = FixtureClient(os.environ["BLUEBARGE_SHEETS_FIXTURE"])
+    auth_exchange_count = lambda: 0
+else:
+    from bluebarge.auth import auth_exchange_count, get_client
 
-# Setup Google Sheets connection
-scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-creds = ServiceAccountCredentials.from_json_keyfile_name(tmp_path, scope)
-client = gspread.authorize(creds)
+    # One authorized client per process, built from in-memory credentials
+    client = get_client(st.secrets["gcp_service_account"])
 
-# Open the sheet
-sheet = client.open("Bluebarge_Comp_Texts").sheet1  # or .worksheet("Sheet1")
-data = pd.DataFrame(sheet.get_all_records())
+# Use case texts live on the first worksheet (sheet1)
+data = load_snapshot().use_cases
 
 print("✅ Google Sheets bağlantısı başarılı!")
+st.sidebar.caption(f"🔑 Sheets auth exchanges (process): {auth_exchange_count()}")
 
 # Sidebar inputs
 
@@ -110,6 +216,26 @@ if st.sidebar.button("🔍 Compatibility Analysis"):
 
 # ✅ Page routing
 if st.session_state.show_analysis:
+    # Analysis page dependencies (no matplotlib here)
+    import numpy as np
+    import folium
+    from streamlit_folium import st_folium
+    from datetime import datetime
+    import pytz
+
+    from bluebarge.compliance import evaluate as evaluate_compliance, windows_for_stay
+    from bluebarge.ports import parse_anchorages, port_coordinates
+    from bluebarge.timeseries import latest_index, latest_observations
+    from bluebarge.weather import WeatherFetchError, fetch_fleet, fetch_marine_and_forecast
+    from bluebarge.weather import cache as weather_cache
+    from bluebarge.scoring import (
+        binary_score,
+        METHODS,
+        demand_profile,
+        expected_plug_type as plug_type_for_ship,
+        scaled_score,
+        standard_for_voltage,
+    )
 
     st.title(" Compatibility Analysis Panel")
     st.markdown("Compare ship-side demand, port capabilities, and BlueBARGE specs.")
@@ -332,7 +458,8 @@ if st.session_state.show_analysis:
     m.add_child(folium.LatLngPopup())
     map_data = st_folium(m, width=700, height=300)
 
-    tf = TimezoneFinder()
+    # Known port cells resolve with a dict lookup; other clicks use polygons
+    port_timezones = load_port_timezones(load_snapshot())
 
     selected_lat = None
     selected_lon = None
@@ -350,39 +477,40 @@ if st.session_state.show_analysis:
 
     if selected_lat and selected_lon:
         if st.button("✅ Confirm and Fetch Data"):
-            timezone_str = tf.timezone_at(lng=selected_lon, lat=selected_lat)
-            if not timezone_str:
-                timezone_str = "UTC"
+            timezone_str = port_timezones.resolve(selected_lat, selected_lon)
             local_tz = pytz.timezone(timezone_str)
 
-            marine_url = f"https://marine-api.open-meteo.com/v1/marine?latitude={selected_lat}&longitude={selected_lon}&hourly=wave_height"
-            marine_response = requests.get(marine_url)
-
-            weather_url = f"https://api.open-meteo.com/v1/forecast?latitude={selected_lat}&longitude={selected_lon}&hourly=wind_speed_10m"
-            weather_response = requests.get(weather_url)
-
-            if (
-                marine_response.status_code == 200
-                and weather_response.status_code == 200
-            ):
-                marine_data = marine_response.json()
-                weather_data = weather_response.json()
+            # Marine + forecast requested concurrently, with timeouts and retries
+            try:
+                marine_data, weather_data = fetch_marine_and_forecast(
+                    selected_lat, selected_lon
+                )
+                fetch_error = None
+            except WeatherFetchError as e:
+                marine_data = weather_data = None
+                fetch_error = e
+
+            cache_stats = weather_cache.stats()
+            st.caption(
+                f"Weather cache: {cache_stats.hits} hits / {cache_stats.misses} misses "
+                f"({cache_stats.hit_rate:.0%} hit rate, {cache_stats.size} cells)"
+            )
 
+            if fetch_error is None:
                 try:
-                    now_utc = datetime.utcnow().replace(tzinfo=pytz.utc)
+                    now_utc = datetime.now(pytz.utc)
+
+                    # Latest value at or before now, found by binary search
+                    latest = {
+                        **latest_observations(marine_data["hourly"], ["wave_height"], now_utc),
+                        **latest_observations(weather_data["hourly"], ["wind_speed_10m"], now_utc),
+                    }
 
                     # Marine Data
-                    wave_times = [
-                        datetime.fromisoformat(t).replace(tzinfo=pytz.utc)
-                        for t in marine_data["hourly"]["time"]
-                    ]
-                    wave_values = marine_data["hourly"]["wave_height"]
-                    wave_closest = [
-                        (t, v) for t, v in zip(wave_times, wave_values) if t <= now_utc
-                    ]
-                    if wave_closest:
-                        latest_wave_time_utc, latest_wave_value = wave_closest[-1]
-                        latest_wave_time_local = latest_wave_time_utc.astimezone(
+                    wave_obs = latest["wave_height"]
+                    if wave_obs is not None:
+                        latest_wave_value = wave_obs.value
+                        latest_wave_time_local = wave_obs.time.astimezone(
                             local_tz
                         ).strftime("%Y-%m-%d %H:%M")
                     else:
@@ -390,17 +518,10 @@ if st.session_state.show_analysis:
                         latest_wave_time_local = "N/A"
 
                     # Weather Data
-                    wind_times = [
-                        datetime.fromisoformat(t).replace(tzinfo=pytz.utc)
-                        for t in weather_data["hourly"]["time"]
-                    ]
-                    wind_values = weather_data["hourly"]["wind_speed_10m"]
-                    wind_closest = [
-                        (t, v) for t, v in zip(wind_times, wind_values) if t <= now_utc
-                    ]
-                    if wind_closest:
-                        latest_wind_time_utc, latest_wind_value = wind_closest[-1]
-                        latest_wind_time_local = latest_wind_time_utc.astimezone(
+                    wind_obs = latest["wind_speed_10m"]
+                    if wind_obs is not None:
+                        latest_wind_value = wind_obs.value
+                        latest_wind_time_local = wind_obs.time.astimezone(
                             local_tz
                         ).strftime("%Y-%m-%d %H:%M")
                     else:
@@ -472,16 +593,92 @@ if st.session_state.show_analysis:
                         st.markdown("### 🌡️ Weather Compliance Check")
                         st.table(weather_df)
 
+                        # Every threshold over the whole forecast horizon
+                        compliance = evaluate_compliance(
+                            weather_thresholds,
+                            marine_data["hourly"],
+                            weather_data["hourly"],
+                            now=now_utc,
+                        )
+                        windows = compliance.windows
+                        st.session_state["weather_windows"] = windows
+                        st.markdown("### 🗓️ Feasible Connection Windows")
+                        if compliance.skipped:
+                            st.caption(
+                                f"No forecast series for: {', '.join(map(str, compliance.skipped))}"
+                            )
+                        if windows.empty:
+                            st.warning("⚠️ No hour in the forecast meets all weather thresholds.")
+                        else:
+                            st.table(
+                                pd.DataFrame(
+                                    {
+                                        "Start": windows["start"].dt.tz_convert(timezone_str).dt.strftime("%Y-%m-%d %H:%M"),
+                                        "End": windows["end"].dt.tz_convert(timezone_str).dt.strftime("%Y-%m-%d %H:%M"),
+                                        "Duration (h)": windows["duration_h"],
+                                    }
+                                )
+                            )
+
                     except Exception as e:
                         st.error(f"❌ Weather compliance comparison failed: {e}")
 
                 except Exception as e:
                     st.error(f"❌ Data processing failed: {e}")
             else:
-                st.error("❌ Failed to fetch data from APIs.")
+                st.error(f"❌ Failed to fetch data from APIs: {fetch_error}")
     else:
         st.info("Please click a location on the map to proceed.")
 
+    # 🌍 Fleet-wide weather: every known port in one marine + one forecast request
+    with st.expander("🌍 Fleet Weather Overview"):
+        scheduler = compliance_scheduler()
+        precomputed = scheduler.latest
+        last_run = (
+            scheduler.last_run.strftime("%Y-%m-%d %H:%M UTC") if scheduler.last_run else "not finished yet"
+        )
+        if scheduler.last_error:
+            st.warning(
+                f"⚠️ Background compliance refresh failed: {scheduler.last_error} (last run: {last_run})"
+            )
+        if precomputed is None:
+            st.info(f"⏳ Pre-computed weather compliance: awaiting first refresh (last run: {last_run}).")
+        elif precomputed.summary.empty:
+            st.info(f"Pre-computed weather compliance: no port with coordinates (last run: {last_run}).")
+        else:
+            age_min = precomputed.age_seconds() / 60
+            st.markdown(
+                f"**Pre-computed weather compliance** (updated {age_min:.0f} min ago, last run: {last_run})"
+            )
+            st.dataframe(precomputed.summary)
+
+        fleet_ports = port_coordinates(load_equipment_data())
+        extra_anchorages = st.text_area(
+            "Additional anchorages (one per line: name, lat, lon)",
+            key="fleet_anchorages",
+        )
+        fleet_ports = pd.concat(
+            [fleet_ports, parse_anchorages(extra_anchorages)], ignore_index=True
+        )
+
+        if fleet_ports.empty:
+            st.info(
+                "No port coordinates found. Add Latitude/Longitude columns to the Equipment List or enter anchorages above."
+            )
+        elif st.button("🌍 Fetch Fleet Weather"):
+            try:
+                fleet = fetch_fleet(list(zip(fleet_ports["lat"], fleet_ports["lon"])))
+                now_idx = latest_index(fleet.epochs)
+                if now_idx < 0:
+                    st.warning("⚠️ No current hour in the fleet forecast.")
+                else:
+                    overview = fleet_ports.copy()
+                    for var, grid in fleet.values.items():
+                        overview[var] = grid[:, now_idx]
+                    st.dataframe(overview)
+            except WeatherFetchError as e:
+                st.error(f"❌ Failed to fetch fleet weather: {e}")
+
     # 1️⃣  Ship Type Selector
     try:
         ship_demand_df = load_ship_demand()
@@ -490,11 +687,8 @@ if st.session_state.show_analysis:
         )
         selected_ship = ship_demand_df[ship_demand_df["ship_type"] == ship_type].iloc[0]
 
-        # Load Voltage Compatibility data
-        voltage_sheet = client.open("Bluebarge_Comp_Texts").worksheet(
-            "Voltage Compatibility"
-        )
-        voltage_df = pd.DataFrame(voltage_sheet.get_all_records())
+        # Ship demand resolved per method and voltage, once per snapshot
+        demand_table = load_demand_table(load_snapshot())
 
     except Exception as e:
         st.warning(f"Could not load ship demand data: {e}")
@@ -504,47 +698,27 @@ if st.session_state.show_analysis:
     if selected_ship is not None:
         method = st.radio(
             "Select estimation method for power/energy:",
-            ["IMO", "EMSA", "LF", "Average"],
+            list(METHODS),
         )
 
-        if method == "IMO":
-            power = selected_ship["power_imo_mw"]
-            energy = selected_ship["energy_imo_mwh"]
-        elif method == "EMSA":
-            power = selected_ship["power_emsa_mw"]
-            energy = selected_ship["energy_emsa_mwh"]
-        elif method == "LF":
-            power = selected_ship["power_lf_mw"]
-            energy = selected_ship["energy_lf_mwh"]
-        elif method == "Average":
-            power = round(
-                np.mean(
-                    [
-                        selected_ship["power_imo_mw"],
-                        selected_ship["power_emsa_mw"],
-                        selected_ship["power_lf_mw"],
-                    ]
-                ),
-                2,
-            )  # ⬅️ round to 2 decimal places
-
-            energy = round(
-                np.mean(
-                    [
-                        selected_ship["energy_imo_mwh"],
-                        selected_ship["energy_emsa_mwh"],
-                        selected_ship["energy_lf_mwh"],
-                    ]
-                ),
-                2,
-            )
+        demand_row = demand_table.lookup(ship_type, method)
+        uc_demand = demand_profile(
+            demand_row["required_power_mw"], demand_row["required_energy_mwh"]
+        )
 
-        uc_demand = {
-            "required_power_mw": power,
-            "required_energy_mwh": energy,
-            "required_standard": None,
-            "required_voltage": None,
-        }
+        # Weather windows from the last fetch vs. this ship's average stay
+        weather_windows = st.session_state.get("weather_windows")
+        if weather_windows is not None:
+            stay_h = float(selected_ship["avg_time_h"])
+            long_enough = windows_for_stay(weather_windows, stay_h)
+            if long_enough.empty:
+                st.warning(
+                    f"⚠️ No weather window in the forecast covers the average stay of {stay_h:g} h."
+                )
+            else:
+                st.info(
+                    f"🗓️ {len(long_enough)} weather window(s) cover the average stay of {stay_h:g} h."
+                )
 
         # 🚩 Regulatory Compliance Declaration
         # st.markdown("###  Regulatory Compliance Declaration")
@@ -563,45 +737,29 @@ if st.session_state.show_analysis:
             st.info("Please answer this question to proceed.")
             st.stop()
 
-        # Radio button to choose power/energy estimation method
-        # Lookup HV/LV capabilities from voltage compatibility sheet
-        voltage_row = voltage_df[voltage_df["ship_type"] == ship_type]
-        supports_hv = voltage_row.iloc[0]["supports HV"] == "Yes"
-        supports_lv = voltage_row.iloc[0]["supports LV"] == "Yes"
-
         required_power = uc_demand["required_power_mw"]
 
-        # Decide voltage
-        if supports_hv and supports_lv:
-            if required_power > 1.0:
-                selected_voltage = "HV"
-                st.info(
-                    f"⚡ Required power is {required_power:.2f} MW > 1 MW → High Voltage (HV) enforced."
-                )
-            else:
-                selected_voltage = st.radio(
-                    "Select connection voltage for this ship:", ["HV", "LV"]
-                )
-        elif supports_hv:
-            selected_voltage = "HV"
+        # Voltage decision (HV/LV support and the >1 MW rule) from the demand table
+        voltage_reason = demand_row["voltage_reason"]
+        selected_voltage = demand_row["enforced_voltage"]
+        if voltage_reason == "enforced":
+            st.info(
+                f"⚡ Required power is {required_power:.2f} MW > 1 MW → High Voltage (HV) enforced."
+            )
+        elif voltage_reason == "choice":
+            selected_voltage = st.radio(
+                "Select connection voltage for this ship:", list(demand_row["voltage_options"])
+            )
+        elif voltage_reason == "hv_only":
             st.info("⚡ Ship supports only High Voltage (HV).")
-        elif supports_lv:
-            selected_voltage = "LV"
+        elif voltage_reason == "lv_only":
             st.info("⚡ Ship supports only Low Voltage (LV).")
         else:
-            selected_voltage = None
             st.error("No voltage connection option available.")
 
-        # ✅ Now set the final voltage into demand profile
+        # ✅ Now set the final voltage and its standard into demand profile
         uc_demand["required_voltage"] = selected_voltage
-
-        # 🛡 Set standard dynamically based on voltage
-        if selected_voltage == "HV":
-            uc_demand["required_standard"] = "IEC 80005-1"
-        elif selected_voltage == "LV":
-            uc_demand["required_standard"] = "IEC 80005-3"
-        else:
-            uc_demand["required_standard"] = None
+        uc_demand["required_standard"] = standard_for_voltage(selected_voltage)
 
     with st.expander("🧪 Try a Compatibility Match (Sample)", expanded=True):
 
@@ -612,14 +770,6 @@ if st.session_state.show_analysis:
             "voltage_levels": ["LV"],
         }
 
-        def scaled_score(barge_val, required_val):
-            if required_val == 0:
-                return 0
-            return min((barge_val / required_val), 1.0) * 100
-
-        def binary_score(barge_val, required_val):
-            return 100 if required_val in barge_val else 0
-
         score_data = [
             {
                 "Factor": "Power Capacity",
@@ -669,48 +819,169 @@ if st.session_state.show_analysis:
         if "Selection" not in param_config_df.columns:
             param_config_df["Selection"] = False
 
+    # 🚤 Several barges, several concurrent calls: best overall pairing
+    # Demand of every ship type under the selected method (fleet tools below)
+    method_demand = demand_table.for_method(method)
+
+    with st.expander("🚤 Barge Fleet Assignment"):
+        st.markdown("Barges:")
+        fleet_df = st.data_editor(
+            pd.DataFrame(
+                {
+                    "name": ["Barge 1", "Barge 2"],
+                    "power_mw": [6.5, 12.0],
+                    "energy_mwh": [30.0, 80.0],
+                    "standards": ["IEC 80005-3", "IEC 80005-1, IEC 80005-3"],
+                    "voltage_levels": ["LV", "HV, LV"],
+                }
+            ),
+            num_rows="dynamic",
+            key="fleet_barges",
+        )
+        st.markdown(f"Concurrent calls per ship type ({method} estimate):")
+        call_counts = st.data_editor(
+            pd.DataFrame({"ship_type": ship_demand_df["ship_type"].unique(), "calls": 1}),
+            disabled=["ship_type"],
+            key="fleet_calls",
+        )
+        demand = method_demand.merge(call_counts, on="ship_type")
+        # blank or non-numeric cells in the editor count as no calls
+        n_calls = pd.to_numeric(demand["calls"], errors="coerce").fillna(0).clip(lower=0).astype(int)
+        calls_df = demand.loc[demand.index.repeat(n_calls)]
+        if fleet_df.dropna(subset=["power_mw", "energy_mwh"]).empty or calls_df.empty:
+            st.info("Add at least one barge and one call.")
+        elif st.checkbox("Solve the assignment", key="fleet_solve"):
+            # the solver (and scipy) only loads once asked for
+            from bluebarge.assignment import assign
+
+            plan = assign(fleet_df.dropna(subset=["power_mw", "energy_mwh"]), calls_df)
+            st.dataframe(
+                plan[
+                    [
+                        "ship_type",
+                        "required_power_mw",
+                        "required_energy_mwh",
+                        "required_voltage",
+                        "barge_name",
+                        "score",
+                    ]
+                ],
+                hide_index=True,
+            )
+            unserved = int((plan["barge"] < 0).sum())
+            if unserved:
+                st.warning(f"⚠️ {unserved} call(s) without a compatible free barge.")
+
+    # 🧭 Many candidate designs: which are not beaten on both score and cost?
+    with st.expander("🧭 Barge Design Explorer"):
+        exp_cols = st.columns(3)
+        n_designs = exp_cols[0].select_slider(
+            "Candidates", [1_000, 10_000, 100_000], value=10_000, key="pareto_n"
+        )
+        power_range = exp_cols[1].slider("Power (MW)", 0.5, 30.0, (1.0, 15.0), key="pareto_power")
+        energy_range = exp_cols[2].slider(
+            "Energy (MWh)", 5.0, 300.0, (10.0, 150.0), key="pareto_energy"
+        )
+        cost_cols = st.columns(3)
+        cost_mw = cost_cols[0].number_input("Cost per MW", 0.0, value=1.0, key="pareto_cost_mw")
+        cost_mwh = cost_cols[1].number_input("Cost per MWh", 0.0, value=0.2, key="pareto_cost_mwh")
+        cost_dual = cost_cols[2].number_input(
+            "Cost of HV + LV", 0.0, value=1.0, key="pareto_cost_dual"
+        )
+        per_ship_type = st.checkbox(
+            "One objective per ship type (instead of the call-weighted mean score)",
+            key="pareto_per_ship",
+        )
+
+        frontier = explore_designs(
+            load_snapshot(),
+            method,
+            n_designs,
+            power_range,
+            energy_range,
+            (cost_mw, cost_mwh, cost_dual),
+            per_ship_type,
+        )
+        st.markdown(f"**{len(frontier)}** non-dominated designs out of {n_designs:,}:")
+        st.scatter_chart(frontier, x="cost", y="mean_score")
+        st.dataframe(frontier, hide_index=True)
+
     # --- Load editable parameters from Google Sheet --
 
     equipment_df = load_equipment_data()
 
+    # 🚢 Fleet-wide: every ship type x voltage x port in one pass
+    with st.expander("🚢 Fleet-wide Compatibility Matrix"):
+        matrix = load_compatibility_matrix(load_snapshot())
+        matrix_voltage = st.radio(
+            "Connection voltage", list(matrix.voltages), horizontal=True, key="matrix_voltage"
+        )
+        v = matrix.voltages.index(matrix_voltage)
+        st.markdown("Compatible equipment count per port and ship type:")
+        st.dataframe(
+            pd.DataFrame(
+                matrix.counts[:, v, :].T,
+                index=list(matrix.ports),
+                columns=list(matrix.ship_types),
+            )
+        )
+
+    # 🏆 Every port ranked for this ship's demand profile
+    with st.expander("🏆 Best Ports for this Ship"):
+        from bluebarge.ranking import CAPACITY_CRITERIA, capacity_weights, rank_ports
+
+        top_k = st.slider("Show top", 1, 50, 10, key="best_ports_top_k")
+        ranking = rank_ports(
+            load_equipment_index(load_snapshot()),
+            uc_demand,
+            plug_type_for_ship(ship_type),
+            top_k=top_k,
+            weights=capacity_weights(load_param_config()),
+            equipment=equipment_df,
+        )
+        st.dataframe(ranking, hide_index=True)
+        capacity_columns = [column for column, _ in CAPACITY_CRITERIA.values()]
+        if not set(capacity_columns) & set(equipment_df.columns):
+            st.caption(
+                f"ℹ️ No {' / '.join(capacity_columns)} column in the Equipment List: "
+                "ports are not scored on capacity."
+            )
+
     #  Port and Ship Compatibility Matching
     st.header(" Port and Ship Equipment Compatibility")
 
     available_ports = equipment_df["Port"].dropna().unique()
     selected_port = st.selectbox("Select a Port", available_ports)
 
-    port_equipment = equipment_df[equipment_df["Port"] == selected_port].copy()
+    # GEMİ → PLUG eşleşmesi (shared with the fleet-wide matrix)
+    expected_plug_type = plug_type_for_ship(ship_type)
 
-    # GEMİ → PLUG eşleşmesi
-    shiptype_to_plugtype = {
-        "Bulk carrier": "General Cargo",
-        "Container ship": "Container",
-        "Container": "Container",
-        "Ro-Pax": "Ro-Pax",
-        "Cruise": "Cruise",
-        # gerekirse diğerleri de eklenebilir
-    }
-    expected_plug_type = shiptype_to_plugtype.get(ship_type, ship_type)
+    # Precomputed attribute bitsets instead of rescanning the frame
+    equipment_index = load_equipment_index(load_snapshot())
+    port_rows = equipment_index.value_rows("port", selected_port)
+    port_equipment = equipment_df.iloc[port_rows].copy()
 
     #  Her eşleşme sütununu tek tek kontrol et
-    port_equipment["Plug Match"] = (
-        port_equipment["Plug Type"].str.lower() == expected_plug_type.lower()
-    )
-    port_equipment["Barge Match"] = port_equipment["Barge Service"].str.lower() == "yes"
-    port_equipment["Voltage Match"] = (
-        port_equipment["Voltage Level"].str.upper() == uc_demand["required_voltage"]
-    )
-    port_equipment["Standard Match"] = (
-        port_equipment["Standard (IEC)"].str.upper() == uc_demand["required_standard"]
-    )
+    criteria_bits = {
+        "Plug Match": equipment_index.bitset("plug", expected_plug_type),
+        "Barge Match": equipment_index.bitset("barge", "yes"),
+        "Voltage Match": equipment_index.bitset("voltage", uc_demand["required_voltage"]),
+        "Standard Match": equipment_index.bitset("standard", uc_demand["required_standard"]),
+    }
+    for column, bits in criteria_bits.items():
+        port_equipment[column] = equipment_index.flags(bits, port_rows)
 
     # ✅ Tüm kriterleri sağlayanları al
-    compatible_equipment = port_equipment[
-        port_equipment["Plug Match"]
-        & port_equipment["Barge Match"]
-        & port_equipment["Voltage Match"]
-        & port_equipment["Standard Match"]
-    ]
+    compatible_rows = equipment_index.rows(
+        equipment_index.match(
+            port=selected_port,
+            plug=expected_plug_type,
+            barge="yes",
+            voltage=uc_demand["required_voltage"],
+            standard=uc_demand["required_standard"],
+        )
+    )
+    compatible_equipment = equipment_df.iloc[compatible_rows]
 
     # 🖥️ Tam tabloyu göster
     st.markdown(f"###  Equipment at {selected_port}")
@@ -804,10 +1075,20 @@ if st.session_state.show_analysis:
 
         must_submitted = st.form_submit_button("✅ Confirm Required Parameters")
 
+    # a confirmation only holds for the selection and must-haves it was given for
+    must_selection = (
+        ship_type,
+        method,
+        uc_demand.get("required_voltage"),
+        selected_port,
+        tuple(must_df["Parameter ID"].astype(str)),
+    )
+
     # ✅ Eğer form gönderildiyse kontrol et
     if must_submitted:
         not_selected = must_df[must_df["Selection"] != True]
         if not not_selected.empty:
+            st.session_state["must_confirmed"] = None
             missing_names = not_selected["Name"].tolist()
             st.error(
                 f"❌ You must select all required parameters before proceeding: {', '.join(missing_names)}"
@@ -816,8 +1097,10 @@ if st.session_state.show_analysis:
         else:
             st.success("✅ All required parameters confirmed.")
             show_weighted_compatibility_score = True
+            st.session_state["must_confirmed"] = must_selection
     else:
-        show_weighted_compatibility_score = False
+        # stay confirmed across reruns triggered by the widgets below
+        show_weighted_compatibility_score = st.session_state.get("must_confirmed") == must_selection
 
     # ✅ MUST-HAVE tamamlandıysa bu bölüm çalışacak
     if (
@@ -828,6 +1111,11 @@ if st.session_state.show_analysis:
         st.markdown("##  Weighted Compatibility Score")
 
         scoring_rows = []
+        scored_ids = []
+        # Parameter ID -> scorer and required-value source (Analysis sheet)
+        scorers = load_scorer_registry(load_snapshot())
+        for problem in scorers.problems:
+            st.warning(f"⚠️ Analysis sheet: {problem}.")
 
         for idx, row in param_config_df.iterrows():
 
@@ -842,21 +1130,8 @@ if st.session_state.show_analysis:
                 continue
 
             weight = float(row["Default Weight"])
-            name_key = param_name.lower()
-
-            if name_key == "power capacity match":
-                required = uc_demand.get("required_power_mw", 1.0)
-            elif name_key == "energy autonomy":
-                required = uc_demand.get("required_energy_mwh", 1.0)
-            elif name_key == "standards compliance":
-                required = 1.0 if uc_demand.get("required_standard") else 0.0
-            elif name_key == "vessel gross tonnage":
-                required = selected_ship.get("gt", 0)
-            elif name_key == "port power capacity":
-                required = uc_demand.get("required_power_mw", 1.0)
-            elif name_key == "port energy capacity":
-                required = uc_demand.get("required_energy_mwh", 1.0)
-            else:
+            required = scorers[param_id].required(uc_demand, selected_ship)
+            if required is None:
                 required = st.number_input(
                     f"{param_name} - Required Value",
                     key=f"req_{param_name}",
@@ -870,23 +1145,36 @@ if st.session_state.show_analysis:
                 min_value=0.0,
                 value=1.0,
             )
-        
-            score = compute_score_contribution(required, provided, weight)
 
+            scored_ids.append(param_id)
             scoring_rows.append(
                 {
                     "Parameter": param_name,
-                    "Required Value": round(required, 4),
-                    "Barge Value": round(provided, 4),
-                    "Weight": round(weight, 4),
-                    "Score Contribution": score,
+                    "Required Value": required,
+                    "Barge Value": provided,
+                    "Weight": weight,
                 }
             )
 
         score_df = pd.DataFrame(scoring_rows)
 
-        if not score_df.empty and "Score Contribution" in score_df.columns:
-            total_score = round(score_df["Score Contribution"].sum(), 4)
+        if not score_df.empty:
+            # unrounded inputs, for comparing other barges on the same terms
+            selected_params = score_df[["Parameter", "Required Value", "Weight"]].assign(
+                **{"Parameter ID": scored_ids}
+            )
+
+            # all selected parameters in one vectorized call
+            contributions, total_score = scorers.score(
+                scored_ids,
+                score_df["Required Value"].to_numpy(float),
+                score_df["Barge Value"].to_numpy(float),
+                score_df["Weight"].to_numpy(float),
+            )
+            score_df[["Required Value", "Barge Value", "Weight"]] = score_df[
+                ["Required Value", "Barge Value", "Weight"]
+            ].round(4)
+            score_df["Score Contribution"] = contributions
 
             st.markdown("### 📋 Compatibility Score Table")
             st.table(score_df)
@@ -894,6 +1182,91 @@ if st.session_state.show_analysis:
             st.markdown(
                 f"### ✅ Total Compatibility Score: `{total_score * 100:.1f} %`"
             )
+
+            # ⚖️ Many barge specs against the same demand, one evaluation
+            with st.expander("⚖️ Compare Barges"):
+                from bluebarge.scorers import rank_barges
+
+                param_names = score_df["Parameter"].tolist()
+                uploaded = st.file_uploader(
+                    "Upload barge specs (CSV: a 'Barge' column and one column per parameter)",
+                    type="csv",
+                    key="compare_upload",
+                )
+                if uploaded is not None:
+                    barge_specs = pd.read_csv(uploaded)
+                else:
+                    # start from the barge entered above
+                    barge_specs = st.data_editor(
+                        pd.DataFrame(
+                            [
+                                {
+                                    "Barge": "Barge 1",
+                                    **dict(zip(param_names, score_df["Barge Value"])),
+                                }
+                            ]
+                        ),
+                        num_rows="dynamic",
+                        key="compare_barges",
+                    )
+                missing = [p for p in param_names if p not in barge_specs.columns]
+                if missing:
+                    st.warning(f"⚠️ No values for {', '.join(missing)}; they score 0.")
+                ranking = rank_barges(scorers, selected_params, barge_specs)
+                st.dataframe(ranking, hide_index=True)
+
+            # 🎲 How stable are these scores and ranks under other weights and values?
+            with st.expander("🎲 Sensitivity Sweep"):
+                from bluebarge.scorers import barge_values
+                from bluebarge.sweep import SweepSpec, tornado
+
+                st.caption("Alternatives: the barges of ⚖️ Compare Barges.")
+                spread = st.slider("Value range (± %)", 0, 100, 20, key="sweep_spread") / 100
+                n_scenarios = st.select_slider(
+                    "Scenarios", [10_000, 100_000, 1_000_000], value=100_000, key="sweep_n"
+                )
+                if barge_specs.empty:
+                    st.info("Add a barge under ⚖️ Compare Barges to run the sweep.")
+                else:
+                    if "Barge" in barge_specs.columns:
+                        barge_names = barge_specs["Barge"].astype(str).tolist()
+                    else:
+                        barge_names = [str(i) for i in range(1, len(barge_specs) + 1)]
+                    required = selected_params["Required Value"].to_numpy(float)
+                    provided = barge_values(barge_specs, param_names)
+                    spec = SweepSpec.build(
+                        selected_params["Weight"].to_numpy(float),
+                        required * (1 - spread),
+                        required * (1 + spread),
+                        provided * (1 - spread),
+                        provided * (1 + spread),
+                        kinds=[scorers[p].kind for p in scored_ids],
+                    )
+                    with st.spinner("Sampling scenarios..."):
+                        distribution, stability, histograms = sweep_summary(
+                            spec.weights,
+                            (spec.required_low, spec.required_high),
+                            (spec.provided_low, spec.provided_high),
+                            n_scenarios,
+                            tuple(barge_names),
+                            spec.kinds,
+                        )
+                    st.markdown("**Total score distribution**")
+                    st.dataframe(distribution, hide_index=True)
+                    st.markdown("**Rank stability**")
+                    st.dataframe(stability, hide_index=True)
+                    shown = 0
+                    if len(barge_names) > 1:
+                        shown = st.selectbox(
+                            "Barge",
+                            range(len(barge_names)),
+                            format_func=lambda i: barge_names[i],
+                            key="sweep_barge",
+                        )
+                    counts, edges = histograms[shown]
+                    st.bar_chart(pd.Series(counts, index=np.round(edges[:-1], 3)))
+                    st.markdown("**Tornado (one input at a time)**")
+                    st.dataframe(tornado(spec, param_names, alternative=shown), hide_index=True)
         else:
             st.warning(
                 "⚠️ No valid scoring data. Please select parameters and enter values."
@@ -938,13 +1311,14 @@ else:
 
         # UC1’e özel alt bölüm
         if use_case == "UC1: Anchored Vessels":
+            # Only the UC1 comparison chart needs matplotlib
+            import matplotlib.pyplot as plt
+            import numpy as np
+
             st.subheader("Anchored Ship Power Demand Lookup")
 
             try:
-                ship_sheet = client.open("Bluebarge_Comp_Texts").worksheet(
-                    "Ship Demand"
-                )
-                ship_demand_df = pd.DataFrame(ship_sheet.get_all_records())
+                ship_demand_df = load_ship_demand()
             except Exception as e:
                 st.error(f"Failed to load ship demand data: {e}")
                 ship_demand_df = None
@@ -1075,3 +1449,68 @@ else:
                     ax.set_xticklabels(ship_demand_df["ship_type"], rotation=15)
                     ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.7)
                     st.pyplot(fig)
+
+                # 📈 Which share of the year's calls does a barge spec cover?
+                with st.expander("📈 Fleet Coverage by Barge Spec"):
+                    from bluebarge.coverage import coverage_grid
+                    from bluebarge.scoring import METHODS
+
+                    cov_method = st.selectbox("Estimation method", METHODS, key="cov_method")
+                    cov_cols = st.columns(2)
+                    max_power = cov_cols[0].slider("Max power (MW)", 1.0, 50.0, 15.0, key="cov_power")
+                    max_energy = cov_cols[1].slider(
+                        "Max energy (MWh)", 10.0, 500.0, 150.0, key="cov_energy"
+                    )
+                    steps = st.slider("Grid resolution", 10, 200, 60, key="cov_steps")
+                    grid = coverage_grid(
+                        load_demand_table(load_snapshot()),
+                        np.linspace(0.0, max_power, steps),
+                        np.linspace(0.0, max_energy, steps),
+                        methods=[cov_method],
+                    )
+                    cov_fig, cov_ax = plt.subplots(figsize=(8, 6))
+                    image = cov_ax.imshow(
+                        grid.share[cov_method] * 100,
+                        origin="lower",
+                        aspect="auto",
+                        extent=[0.0, max_energy, 0.0, max_power],
+                        vmin=0,
+                        vmax=100,
+                        cmap="viridis",
+                    )
+                    cov_fig.colorbar(image, ax=cov_ax, label="Calls covered (%)")
+                    cov_ax.set_xlabel("Barge energy (MWh)")
+                    cov_ax.set_ylabel("Barge power (MW)")
+                    cov_ax.set_title(f"Share of annual port calls fully covered ({cov_method})")
+                    st.pyplot(cov_fig)
+
+                # ⏱️ A year of calls against a barge fleet, not just static bars
+                with st.expander("⏱️ Annual Barge Simulation"):
+                    from bluebarge.scoring import METHODS
+                    from bluebarge.simulation import BargeSpec, simulate_year
+
+                    sim_method = st.selectbox("Estimation method", METHODS, key="sim_method")
+                    sim_cols = st.columns(4)
+                    n_barges = sim_cols[0].number_input("Barges", 1, 50, 2, key="sim_barges")
+                    capacity = sim_cols[1].number_input(
+                        "Capacity (MWh)", 1.0, 1000.0, 30.0, key="sim_capacity"
+                    )
+                    power = sim_cols[2].number_input("Power (MW)", 0.1, 100.0, 6.5, key="sim_power")
+                    recharge = sim_cols[3].number_input(
+                        "Recharge (MW)", 0.1, 100.0, 5.0, key="sim_recharge"
+                    )
+                    sim_seed = st.number_input("Random seed", 0, 10_000, 0, key="sim_seed")
+
+                    result = simulate_year(
+                        load_demand_table(load_snapshot()),
+                        sim_method,
+                        [BargeSpec(capacity, power, recharge)] * int(n_barges),
+                        seed=int(sim_seed),
+                    )
+                    summary = result.summary()
+                    m1, m2, m3, m4 = st.columns(4)
+                    m1.metric("Calls served", f"{summary['served_calls']} / {summary['calls']}")
+                    m2.metric("Unmet energy", f"{summary['unmet_share'] * 100:.1f} %")
+                    m3.metric("Mean delay", f"{summary['mean_delay_h']:.2f} h")
+                    m4.metric("Utilization", f"{summary['mean_utilization'] * 100:.1f} %")
+                    st.dataframe(result.barges, hide_index=True)
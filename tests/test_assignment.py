@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from bluebarge.assignment import assign
+
+pytest.importorskip("scipy")
+
+BARGES = pd.DataFrame(
+    {
+        "name": ["Small", "Large"],
+        "power_mw": [5.0, 12.0],
+        "energy_mwh": [30.0, 80.0],
+        "standards": ["IEC 80005-1", "IEC 80005-1"],
+        "voltage_levels": ["HV", "HV"],
+    }
+)
+
+
+def _calls(power):
+    return pd.DataFrame(
+        {
+            "ship_type": ["Cruise", "Ferry"],
+            "required_power_mw": power,
+            "required_energy_mwh": [100.0, 20.0],
+            "required_standard": "IEC 80005-1",
+            "required_voltage": "HV",
+        }
+    )
+
+
+def test_best_barge_per_call():
+    plan = assign(BARGES, _calls([10.0, 5.0]))
+    assert plan["barge_name"].tolist() == ["Large", "Small"]
+
+
+def test_call_with_unknown_demand_is_left_unserved():
+    plan = assign(BARGES, _calls([np.nan, 5.0]))
+    assert plan["barge"].tolist()[0] == -1 and np.isnan(plan["score"].iloc[0])
+    assert plan["barge"].iloc[1] >= 0
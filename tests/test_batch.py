@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from bluebarge.batch import ChunkWriter, read_chunks
+
+pytest.importorskip("pyarrow")
+
+
+def _write(path, chunks):
+    writer = ChunkWriter(str(path))
+    try:
+        for chunk in chunks:
+            writer.write(chunk)
+    finally:
+        writer.close()
+    return pd.read_parquet(path)
+
+
+def test_parquet_column_all_null_in_the_first_chunk(tmp_path):
+    first = pd.DataFrame({"ship_type": ["Cruise", "Cruise"], "required_standard": [None, None], "score": [1.0, 2.0]})
+    second = pd.DataFrame({"ship_type": ["Ro-Pax"], "required_standard": ["IEC 80005-1"], "score": [3.0]})
+    result = _write(tmp_path / "scored.parquet", [first, second])
+
+    assert result["required_standard"].tolist()[2] == "IEC 80005-1"
+    assert result["required_standard"].isna().tolist() == [True, True, False]
+    assert result["score"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_parquet_empty_csv_text_column_in_the_first_chunk(tmp_path):
+    # read_csv types an empty column as float
+    calls = tmp_path / "calls.csv"
+    calls.write_text("ship_type,voltage\nCruise,\nCruise,\nRo-Pax,LV\n")
+    result = _write(tmp_path / "scored.parquet", read_chunks(str(calls), chunksize=2))
+
+    assert result["voltage"].tolist()[2] == "LV"
+    assert result["voltage"].isna().tolist() == [True, True, False]
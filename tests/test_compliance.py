@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+from bluebarge.compliance import HOUR, evaluate, run_length_windows, windows_for_stay
+
+T0 = 1_700_000_000 // HOUR * HOUR
+
+
+def _hours(n):
+    return T0 + HOUR * np.arange(n, dtype=np.int64)
+
+
+def _runs(row):
+    """(start, stop) of the True runs of a 1-D mask, by a plain loop."""
+    runs, start = [], None
+    for i, value in enumerate(list(row) + [False]):
+        if value and start is None:
+            start = i
+        elif not value and start is not None:
+            runs.append((start, i))
+            start = None
+    return runs
+
+
+def test_windows_of_one_series():
+    mask = np.array([1, 1, 0, 1, 0, 0, 1, 1, 1], dtype=bool)
+    windows = run_length_windows(_hours(len(mask)), mask)
+
+    assert "location" not in windows.columns
+    assert windows["duration_h"].tolist() == [2, 1, 3]
+    assert windows["start"].tolist() == list(pd.to_datetime(T0 + HOUR * np.array([0, 3, 6]), unit="s", utc=True))
+    # end is exclusive: one hour after the last feasible hour
+    assert windows["end"].iloc[-1] == pd.Timestamp(T0 + 9 * HOUR, unit="s", tz="UTC")
+
+
+def test_windows_match_brute_force_per_location():
+    rng = np.random.default_rng(0)
+    mask = rng.random((6, 40)) < 0.6
+    mask[0] = True  # one run over the whole horizon
+    mask[1] = False  # no run at all
+    windows = run_length_windows(_hours(mask.shape[1]), mask)
+
+    expected = [(loc, a, b) for loc, row in enumerate(mask) for a, b in _runs(row)]
+    starts = (windows["start"] - pd.Timestamp(T0, unit="s", tz="UTC")) // pd.Timedelta(hours=1)
+    got = list(zip(windows["location"], starts, starts + windows["duration_h"]))
+    assert got == expected
+
+
+def test_evaluate_thresholds_inclusive_and_missing_fails():
+    hourly = {
+        "time": [str(np.datetime64(int(t), "s")) for t in _hours(5)],
+        "wave_height": [1.0, 1.5, None, 0.5, 2.0],
+        "wind_speed_10m": [10.0, 10.0, 10.0, 10.0, 10.0],
+    }
+    thresholds = pd.DataFrame(
+        {"Threshold": [1.5, 10.0, 3.0]}, index=pd.Index(["wave_height", "wind_speed", "visibility"], name="Parameter")
+    )
+    result = evaluate(thresholds, hourly, now=int(T0))
+
+    assert result.parameters == ["wave_height", "wind_speed"]
+    assert result.skipped == ["visibility"]
+    assert result.feasible.tolist() == [True, True, False, True, False]
+    assert result.windows["duration_h"].tolist() == [2, 1]
+    assert windows_for_stay(result.windows, 2)["duration_h"].tolist() == [2]
+
+
+def test_evaluate_drops_hours_before_now():
+    hourly = {"time": [str(np.datetime64(int(t), "s")) for t in _hours(4)], "wave_height": [0.1] * 4}
+    thresholds = pd.DataFrame({"Threshold": [1.0]}, index=["wave_height"])
+    result = evaluate(thresholds, hourly, now=int(T0 + 2 * HOUR + 120))
+
+    assert result.epochs.tolist() == _hours(4)[2:].tolist()
+    assert result.windows["duration_h"].tolist() == [2]
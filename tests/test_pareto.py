@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from bluebarge.pareto import pareto_2d, pareto_designs, skyline
+
+
+def _brute_force(points):
+    """First occurrence of every point no other point dominates (all minimized)."""
+    keep = np.zeros(len(points), dtype=bool)
+    for i, p in enumerate(points):
+        dominated = np.any(np.all(points <= p, axis=1) & np.any(points < p, axis=1))
+        duplicate = np.any(np.all(points[:i] == p, axis=1))
+        keep[i] = not dominated and not duplicate
+    return keep
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_pareto_2d_matches_brute_force(seed):
+    points = np.random.default_rng(seed).integers(0, 15, size=(300, 2)).astype(float)
+    assert (pareto_2d(points) == _brute_force(points)).all()
+
+
+@pytest.mark.parametrize("dims", [3, 4, 6])
+@pytest.mark.parametrize("block", [8, 512])
+def test_skyline_matches_brute_force(dims, block):
+    # few distinct values: many ties and duplicates; small blocks run the block loop
+    points = np.random.default_rng(dims).integers(0, 6, size=(400, dims)).astype(float)
+    assert (skyline(points, block=block) == _brute_force(points)).all()
+
+
+def test_skyline_anticorrelated_front_is_kept_whole():
+    x = np.arange(50, dtype=float)
+    points = np.column_stack([x, 49 - x, np.full(50, 1.0)])
+    points = np.vstack([points, points + 1])  # each shifted copy is dominated
+    mask = skyline(points, block=16)
+    assert mask[:50].all() and not mask[50:].any()
+
+
+def test_pareto_designs_keeps_score_cost_tradeoffs():
+    demand = pd.DataFrame(
+        {
+            "required_power_mw": [10.0],
+            "required_energy_mwh": [100.0],
+            "required_standard": ["IEC 80005-1"],
+            "required_voltage": ["HV"],
+        }
+    )
+    candidates = pd.DataFrame(
+        {
+            "power_mw": [5.0, 10.0, 10.0, 2.0],
+            "energy_mwh": [50.0, 100.0, 100.0, 10.0],
+            "standards": ["IEC 80005-1"] * 4,
+            "voltage_levels": ["HV"] * 4,
+            "cost": [5.0, 10.0, 12.0, 6.0],  # same as 1 but dearer; worse and dearer than 0
+        }
+    )
+    frontier = pareto_designs(candidates, demand)
+    assert frontier["cost"].tolist() == [5.0, 10.0]
+    assert frontier["mean_score"].tolist() == [75.0, 100.0]
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from bluebarge.equipment_index import EquipmentIndex
+from bluebarge.ranking import capacity_weights, rank_ports
+
+DEMAND = {
+    "required_power_mw": 10.0,
+    "required_energy_mwh": 100.0,
+    "required_voltage": "HV",
+    "required_standard": "IEC 80005-1",
+}
+PARAMS = pd.DataFrame(
+    {
+        "Name": ["Port Power Capacity", "Port Energy Capacity", "Standards Compliance"],
+        "Default Weight": ["0.3", "0.1", "0.2"],
+    }
+)
+
+
+def _equipment(**capacity):
+    return pd.DataFrame(
+        {
+            "Port": ["A", "B", "C"],
+            "Plug Type": "Cruise",
+            "Voltage Level": ["HV", "HV", "LV"],
+            "Standard (IEC)": ["IEC 80005-1", "IEC 80005-1", "IEC 80005-3"],
+            "Barge Service": "Yes",
+            **capacity,
+        }
+    )
+
+
+def _rank(equipment):
+    return rank_ports(
+        EquipmentIndex.from_frame(equipment), DEMAND, "Cruise", weights=capacity_weights(PARAMS), equipment=equipment
+    )
+
+
+def test_capacity_weights_come_from_the_analysis_sheet():
+    assert capacity_weights(PARAMS) == {"power": 0.3, "energy": 0.1}
+
+
+def test_capacity_difference_changes_the_order():
+    low_first = _rank(_equipment(**{"Port Power Capacity": [0.5, 20.0, 50.0]}))
+    high_first = _rank(_equipment(**{"Port Power Capacity": [20.0, 0.5, 50.0]}))
+
+    assert low_first["Port"].tolist() == ["B", "A", "C"]
+    assert high_first["Port"].tolist() == ["A", "B", "C"]
+    # power only: its weight is all there is; C has nothing compatible to score
+    assert low_first["capacity_score"].tolist()[:2] == [1.0, 0.05]
+    assert np.isnan(low_first["capacity_score"].iloc[2])
+
+
+def test_weights_combine_power_and_energy():
+    ranking = _rank(
+        _equipment(**{"Port Power Capacity": [10.0, 5.0, 0.0], "Port Energy Capacity": [50.0, 100.0, 0.0]})
+    ).set_index("Port")
+    # A: 0.75 * 1 + 0.25 * 0.5, B: 0.75 * 0.5 + 0.25 * 1
+    assert ranking.loc["A", "capacity_score"] == 0.875
+    assert ranking.loc["B", "capacity_score"] == 0.625
+
+
+def test_without_capacity_columns_ports_rank_on_the_checks():
+    ranking = _rank(_equipment())
+    assert ranking["Port"].tolist() == ["A", "B", "C"]
+    assert ranking["compatible_equipment"].tolist() == [1, 1, 0]
+    assert ranking["checks_met"].tolist() == [4, 4, 2]
+    assert ranking["capacity_score"].isna().all()
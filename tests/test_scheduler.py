@@ -0,0 +1,27 @@
+import pandas as pd
+
+from bluebarge.scheduler import ComplianceScheduler
+
+
+def _no_ports():
+    return pd.DataFrame({"Port": ["P1"]}), pd.DataFrame({"Threshold": [1.0]}, index=["wave_height"])
+
+
+def test_last_run_is_unset_until_a_refresh_ends():
+    scheduler = ComplianceScheduler(_no_ports)
+    assert scheduler.latest is None and scheduler.last_run is None
+
+    scheduler.run_once()
+    assert scheduler.last_run is not None
+    assert scheduler.latest.summary.empty and scheduler.last_error is None
+
+
+def test_failed_refresh_records_the_run_and_keeps_no_result():
+    def broken():
+        raise LookupError("sheet unavailable")
+
+    scheduler = ComplianceScheduler(broken)
+    scheduler.run_once()
+    assert scheduler.latest is None
+    assert scheduler.last_error == "sheet unavailable"
+    assert scheduler.last_run is not None
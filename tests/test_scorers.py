@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from bluebarge.scorers import build_registry
+
+PARAMS = pd.DataFrame(
+    {
+        "Parameter ID": ["P1", "P2", "P3"],
+        "Name": ["Power capacity match", "Energy autonomy", "Crew"],
+        "Required Source": [None, "required_energy", "manual"],
+        "Scorer": ["treshold", "threshold", None],
+    }
+)
+
+
+def test_sheet_typos_fall_back_to_the_defaults():
+    registry = build_registry(PARAMS)
+
+    assert registry["P1"].kind == "ratio" and registry["P1"].source == "required_power_mw"
+    # a bad source falls back to the one the name implies, the kind is kept
+    assert registry["P2"].kind == "threshold" and registry["P2"].source == "required_energy_mwh"
+    assert registry["P3"].kind == "ratio" and registry["P3"].source is None
+    assert registry.problems == (
+        "unknown 'Scorer' 'treshold' for P1, scored as ratio",
+        "unknown 'Required Source' 'required_energy' for P2, default source used",
+    )
+
+
+def test_fallback_scores_as_ratio():
+    contributions, total = build_registry(PARAMS).score(["P1"], [10.0], [5.0], [0.4])
+    assert contributions.tolist() == [0.2] and total == 0.2
+
+
+def test_strict_raises():
+    with pytest.raises(ValueError, match="treshold"):
+        build_registry(PARAMS, strict=True)
+
+
+def test_clean_sheet_has_no_problems():
+    assert build_registry(PARAMS.drop(columns=["Required Source", "Scorer"])).problems == ()
@@ -0,0 +1,45 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bluebarge.scoring import compute_score_contribution, round_like_python, score_contributions
+
+# the Analysis sheet's ranges: values in 0.5 steps, weights in 0.05 steps
+VALUES = [x / 2 for x in range(21)]
+WEIGHTS = [x / 20 for x in range(21)]
+
+
+def test_contributions_match_the_scalar_rule():
+    grid = np.array(list(itertools.product(VALUES, VALUES, WEIGHTS)))
+    required, provided, weight = grid.T
+    contributions, _ = score_contributions(required[:, None], provided[:, None], weight[:, None])
+
+    expected = [compute_score_contribution(r, p, w) for r, p, w in grid.tolist()]
+    assert contributions[:, 0].tolist() == expected
+
+
+@pytest.mark.parametrize("required, provided, weight, expected", [(4.0, 0.5, 0.05, 0.0063), (4.0, 0.5, 0.15, 0.0187)])
+def test_ties_round_like_python(required, provided, weight, expected):
+    contributions, _ = score_contributions(required, provided, weight)
+    assert contributions.item() == compute_score_contribution(required, provided, weight) == expected
+
+
+def test_totals_match_the_page():
+    rng = np.random.default_rng(0)
+    required = rng.choice(VALUES, size=(500, 4))
+    provided = rng.choice(VALUES, size=(500, 4))
+    weight = rng.choice(WEIGHTS, size=(500, 4))
+    contributions, totals = score_contributions(required, provided, weight)
+
+    for row, total in zip(contributions, totals):
+        assert total == round(pd.Series(row).sum(), 4)
+
+
+def test_round_like_python_keeps_shape_and_nan():
+    values = np.array([[0.00625, np.nan], [1.23455, 2.0]])
+    rounded = round_like_python(values, 4)
+    assert rounded.shape == values.shape
+    assert np.isnan(rounded[0, 1])
+    assert rounded[0, 0] == round(0.00625, 4) and rounded[1, 0] == round(1.23455, 4)
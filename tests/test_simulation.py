@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from bluebarge.demand import build_demand_table
+from bluebarge.simulation import BargeSpec, generate_arrivals, simulate, simulate_year
+
+
+def _calls(*rows):
+    """Calls from (arrival_h, stay_h, energy_mwh) tuples."""
+    frame = pd.DataFrame(rows, columns=["arrival_h", "stay_h", "energy_mwh"], dtype=float)
+    frame.insert(0, "ship_type", "Cruise")
+    return frame
+
+
+def _demand(calls_per_year=500, ro_pax_stay=5, ro_pax_energy=20.0, ro_pax_calls=0):
+    ship_demand = pd.DataFrame(
+        {
+            "ship_type": ["Cruise", "Ro-Pax"],
+            "power_imo_mw": [10.0, 2.0],
+            "power_emsa_mw": [10.0, 2.0],
+            "power_lf_mw": [10.0, 2.0],
+            "energy_imo_mwh": [100.0, ro_pax_energy],
+            "energy_emsa_mwh": [100.0, ro_pax_energy],
+            "energy_lf_mwh": [100.0, ro_pax_energy],
+            "avg_time_h": [10, ro_pax_stay],
+            "port_calls (no.)": [calls_per_year, ro_pax_calls],
+            "gt": [30000, 10000],
+        }
+    )
+    support = pd.DataFrame({"ship_type": ["Cruise", "Ro-Pax"], "supports HV": "Yes", "supports LV": "Yes"})
+    return build_demand_table(ship_demand, support)
+
+
+def test_one_call_fully_served():
+    result = simulate(_calls((1.0, 10.0, 20.0)), [BargeSpec(50.0, 5.0, 5.0)])
+    call = result.calls.iloc[0]
+
+    assert call["barge"] == 0 and call["delay_h"] == 0.0
+    assert call["delivered_mwh"] == pytest.approx(20.0)
+    assert call["unmet_mwh"] == pytest.approx(0.0)
+    assert result.barges["utilization"].iloc[0] == pytest.approx(10.0 / 8760, abs=1e-4)
+
+
+@pytest.mark.parametrize(
+    "barge, delivered",
+    [
+        (BargeSpec(capacity_mwh=15.0, power_mw=5.0, recharge_mw=5.0), 15.0),  # runs out of charge
+        (BargeSpec(capacity_mwh=50.0, power_mw=1.0, recharge_mw=5.0), 10.0),  # power below the load
+    ],
+)
+def test_capacity_and_power_limit_delivery(barge, delivered):
+    call = simulate(_calls((0.0, 10.0, 20.0)), [barge]).calls.iloc[0]
+    assert call["delivered_mwh"] == pytest.approx(delivered)
+    assert call["unmet_mwh"] == pytest.approx(20.0 - delivered)
+
+
+def test_waiting_call_is_served_after_recharge_first_come_first_served():
+    # call 0 empties 10 MWh of the barge by t=10, recharging takes 2 h at 5 MW
+    calls = _calls((0.0, 10.0, 10.0), (5.0, 20.0, 20.0), (6.0, 20.0, 20.0))
+    result = simulate(calls, [BargeSpec(100.0, 10.0, 5.0)])
+
+    assert result.calls["barge"].tolist() == [0, 0, -1]
+    assert result.calls["delay_h"].iloc[1] == pytest.approx(7.0)
+    # call 1 only draws from t=12 to its departure at t=25
+    assert result.calls["delivered_mwh"].iloc[1] == pytest.approx(13.0)
+    # call 2 left (t=26) while the barge was still busy or recharging
+    assert result.calls["unmet_mwh"].iloc[2] == pytest.approx(20.0)
+    assert result.summary()["dropped_calls"] == 1
+
+
+def test_freed_barge_serves_an_arrival_at_the_same_time():
+    # nothing drawn, so the barge is recharged the moment call 0 leaves
+    calls = _calls((0.0, 10.0, 0.0), (10.0, 5.0, 5.0))
+    result = simulate(calls, [BargeSpec(50.0, 5.0, 5.0)])
+    assert result.calls["barge"].tolist() == [0, 0]
+    assert result.calls["delay_h"].tolist() == [0.0, 0.0]
+
+
+def test_arrivals_are_reproducible_and_sorted():
+    demand = _demand()
+    a = generate_arrivals(demand, "IMO", np.random.default_rng(7))
+    b = generate_arrivals(demand, "IMO", np.random.default_rng(7))
+
+    pd.testing.assert_frame_equal(a, b)
+    assert a["arrival_h"].is_monotonic_increasing
+    assert a["arrival_h"].between(0, 8760).all()
+    assert set(a["ship_type"]) == {"Cruise"}  # Ro-Pax has no calls
+    assert abs(len(a) - 500) < 5 * np.sqrt(500)
+
+
+@pytest.mark.parametrize("stay, energy", [("n/a", 20.0), (None, 20.0), (5, np.nan)])
+def test_ship_types_without_stay_or_energy_make_no_calls(stay, energy):
+    demand = _demand(ro_pax_stay=stay, ro_pax_energy=energy, ro_pax_calls=500)
+    calls = generate_arrivals(demand, "IMO", np.random.default_rng(7))
+
+    assert set(calls["ship_type"]) == {"Cruise"}
+    assert calls[["stay_h", "energy_mwh"]].notna().all().all()
+    result = simulate(calls, [BargeSpec(100.0, 10.0, 5.0)])
+    assert result.calls["delivered_mwh"].notna().all()
+    assert np.isfinite(result.barges["utilization"]).all()
+
+
+def test_more_barges_never_leave_more_energy_unmet():
+    demand = _demand(calls_per_year=2000)
+    unmet = [
+        simulate_year(demand, "IMO", [BargeSpec(100.0, 10.0, 5.0)] * n, seed=3).summary()["unmet_share"]
+        for n in (1, 2, 4)
+    ]
+    assert unmet == sorted(unmet, reverse=True)
+    assert unmet[0] > unmet[-1]
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from bluebarge.scorers import build_registry, rank_barges
+from bluebarge.sweep import SweepSpec, run_sweep, tornado
+
+PARAMS = pd.DataFrame(
+    {
+        "Parameter ID": ["P1", "P2"],
+        "Name": ["Power capacity match", "Energy autonomy"],
+        "Scorer": ["ratio", "threshold"],
+    }
+)
+SELECTED = pd.DataFrame(
+    {
+        "Parameter ID": ["P1", "P2"],
+        "Parameter": ["Power", "Energy"],
+        "Required Value": [10.0, 100.0],
+        "Weight": [0.5, 0.5],
+    }
+)
+BARGES = pd.DataFrame({"Barge": ["A", "B"], "Power": [10.0, 5.0], "Energy": [90.0, 100.0]})
+
+
+def _spec(registry):
+    provided = BARGES[["Power", "Energy"]].to_numpy(float)
+    required = SELECTED["Required Value"].to_numpy(float)
+    return SweepSpec.build(
+        SELECTED["Weight"],
+        required,
+        required,
+        provided,
+        provided,
+        concentration=None,
+        kinds=[registry[p].kind for p in SELECTED["Parameter ID"]],
+    )
+
+
+def test_fixed_sweep_scores_like_compare_barges_with_a_threshold():
+    registry = build_registry(PARAMS)
+    ranking = rank_barges(registry, SELECTED, BARGES).set_index("Barge")
+    result = run_sweep(_spec(registry), 50, seed=0, workers=1)
+
+    # A covers 90 % of the energy: half the weight as a ratio, nothing as a threshold
+    assert ranking["Total Score (%)"].to_dict() == {"A": 50.0, "B": 75.0}
+    assert (result.totals * 100 == ranking.loc[["A", "B"], "Total Score (%)"].to_numpy()).all()
+    assert result.first_place.tolist() == [0.0, 1.0]
+    assert result.mean_rank.tolist() == [2.0, 1.0]
+
+
+def test_tornado_uses_the_threshold_kind():
+    spec = _spec(build_registry(PARAMS))
+    spec = SweepSpec.build(
+        spec.weights, spec.required_low, spec.required_high, [10.0, 80.0], [10.0, 120.0], None, spec.kinds
+    )
+    swings = tornado(spec, ["Power", "Energy"]).set_index(["parameter", "factor"])
+    # the energy midpoint meets the requirement; its low end loses the whole weight
+    assert swings.loc[("Energy", "provided"), "low"] == pytest.approx(-0.5)
+    assert swings.loc[("Energy", "provided"), "high"] == pytest.approx(0.0)
+
+
+def test_kinds_default_to_ratio():
+    spec = SweepSpec.build([1.0], [10.0], [10.0], [[5.0]], [[5.0]], concentration=None)
+    assert np.allclose(run_sweep(spec, 3, seed=0, workers=1).totals, 0.5)